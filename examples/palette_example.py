@@ -203,17 +203,17 @@ class PaletteDemo(Gtk.ApplicationWindow):
             self.menu_feedback_label.set_text(msg)
 
         item1 = PaletteMenuItem("Open File", "document-open")
-        item1.connect("activate", lambda x: feedback("Open File clicked"))
+        item1.connect("item-activated", lambda x: feedback("Open File clicked"))
         menu.append(item1)
 
         item2 = PaletteMenuItem("Save File", "document-save")
-        item2.connect("activate", lambda x: feedback("Save File clicked"))
+        item2.connect("item-activated", lambda x: feedback("Save File clicked"))
         menu.append(item2)
 
         menu.append(PaletteMenuItemSeparator())
 
         item3 = PaletteMenuItem("Settings", "preferences-system")
-        item3.connect("activate", lambda x: feedback("Settings clicked"))
+        item3.connect("item-activated", lambda x: feedback("Settings clicked"))
         menu.append(item3)
 
         menu_invoker = WidgetInvoker()
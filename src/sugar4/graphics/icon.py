@@ -85,6 +85,10 @@ class _LRU:
         self.cache[key] = value
         self.order.append(key)
 
+    def clear(self):
+        self.cache.clear()
+        del self.order[:]
+
 
 _BADGE_SIZE = 0.45
 _DEFAULT_ICON_SIZE = 48
@@ -156,7 +160,9 @@ class _IconBuffer:
     """Manages icon rendering and caching."""
 
     _surface_cache = _LRU(100)
+    _texture_cache = _LRU(100)
     _loader = _SVGLoader()
+    _icon_theme_watched = False
 
     def __init__(self):
         self.icon_name: Optional[str] = None
@@ -400,6 +406,44 @@ class _IconBuffer:
 
         return None
 
+    def get_texture(self, sensitive: bool = True) -> Optional[Gdk.Texture]:
+        """Get texture for this icon, shared by identical icons."""
+        self._watch_icon_theme()
+        cache_key = self._get_cache_key(sensitive)
+        if cache_key in self._texture_cache:
+            return self._texture_cache[cache_key]
+
+        surface = self.get_surface(sensitive)
+        if surface is None:
+            return None
+
+        pixbuf = Gdk.pixbuf_get_from_surface(
+            surface, 0, 0, surface.get_width(), surface.get_height()
+        )
+        if pixbuf is None:
+            return None
+
+        texture = Gdk.Texture.new_for_pixbuf(pixbuf)
+        self._texture_cache[cache_key] = texture
+        return texture
+
+    @classmethod
+    def _watch_icon_theme(cls):
+        if cls._icon_theme_watched:
+            return
+        display = Gdk.Display.get_default()
+        if display is None:
+            return
+        icon_theme = Gtk.IconTheme.get_for_display(display)
+        icon_theme.connect("changed", cls._icon_theme_changed_cb)
+        cls._icon_theme_watched = True
+
+    @classmethod
+    def _icon_theme_changed_cb(cls, icon_theme):
+        # Cached renderings may come from files of the previous theme
+        cls._surface_cache.clear()
+        cls._texture_cache.clear()
+
     def _get_size(
         self, icon_width: int, icon_height: int, padding: int
     ) -> Tuple[int, int]:
@@ -596,30 +640,21 @@ class Icon(Gtk.Widget):
 
     def do_snapshot(self, snapshot: Gtk.Snapshot):
         """Render icon using snapshot-based drawing."""
-        surface = self._buffer.get_surface(self.get_sensitive())
-        if surface:
-            width = self.get_width()
-            height = self.get_height()
+        texture = self._buffer.get_texture(self.get_sensitive())
+        if texture:
+            texture_width = texture.get_width()
+            texture_height = texture.get_height()
 
             # Center the icon
-            x = (width - surface.get_width()) / 2
-            y = (height - surface.get_height()) / 2
+            x = (self.get_width() - texture_width) / 2
+            y = (self.get_height() - texture_height) / 2
 
             snapshot.save()
             snapshot.translate(Graphene.Point().init(x, y))
-
-            # Convert surface to pixbuf then to texture
-            pixbuf = Gdk.pixbuf_get_from_surface(
-                surface, 0, 0, surface.get_width(), surface.get_height()
+            snapshot.append_texture(
+                texture,
+                Graphene.Rect().init(0, 0, texture_width, texture_height),
             )
-            if pixbuf:
-                texture = Gdk.Texture.new_for_pixbuf(pixbuf)
-                snapshot.append_texture(
-                    texture,
-                    Graphene.Rect().init(
-                        0, 0, surface.get_width(), surface.get_height()
-                    ),
-                )
             snapshot.restore()
 
     def do_measure(
@@ -759,16 +794,9 @@ class Icon(Gtk.Widget):
         Returns:
             Gtk.Image: Image widget with icon content
         """
-        surface = self._buffer.get_surface(self.get_sensitive())
-        if surface:
-            # Convert surface to pixbuf then to texture
-            pixbuf = Gdk.pixbuf_get_from_surface(
-                surface, 0, 0, surface.get_width(), surface.get_height()
-            )
-            if pixbuf:
-                texture = Gdk.Texture.new_for_pixbuf(pixbuf)
-                image = Gtk.Image.new_from_paintable(texture)
-                return image
+        texture = self._buffer.get_texture(self.get_sensitive())
+        if texture:
+            return Gtk.Image.new_from_paintable(texture)
 
         return Gtk.Image.new_from_icon_name("image-missing")
 
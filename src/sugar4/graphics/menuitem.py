@@ -92,7 +92,7 @@ class MenuItem(Gtk.Button):
             self._label.set_hexpand(True)
             # Force label text to black
             self._label.add_css_class("force-black")
-            style.apply_css_to_widget(self._label, ".force-black { color: #000000; }")
+            style.apply_css_to_display(".force-black { color: #000000; }")
 
             if text_maxlen > 0:
                 self._label.set_ellipsize(style.ELLIPSIZE_MODE_DEFAULT)
@@ -27,7 +27,7 @@ import gi
 gi.require_version("Gtk", "4.0")
 gi.require_version("Gdk", "4.0")
 
-from gi.repository import GLib, Gtk, Gdk, GObject, Pango, Graphene
+from gi.repository import Gtk, Gdk, GObject, Pango, Graphene
 
 from sugar4.graphics import style
 from sugar4.graphics.icon import Icon
@@ -53,6 +53,11 @@ assert CursorInvoker
 assert ToolInvoker
 assert TreeViewInvoker
 
+# The primary text is always rendered bold, so share a single attribute
+# list instead of escaping and re-parsing markup on every update.
+_BOLD_ATTRS = Pango.AttrList()
+_BOLD_ATTRS.insert(Pango.attr_weight_new(Pango.Weight.BOLD))
+
 
 class _HeaderItem(Gtk.Widget):
     """A custom widget for palette headers.
@@ -159,6 +164,7 @@ class Palette(PaletteWindow):
         self._secondary_text = None
         self._icon = None
         self._icon_visible = True
+        self._full_request_dirty = True
 
         # header container
         self._primary_event_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
@@ -214,8 +220,7 @@ class Palette(PaletteWindow):
 
         self._add_content()
 
-        self.action_bar = PaletteActionBar()
-        self._secondary_box.append(self.action_bar)
+        self._action_bar = None
 
         self.connect("notify::invoker", self.__notify_invoker_cb)
 
@@ -231,6 +236,8 @@ class Palette(PaletteWindow):
         self.popdown(immediate=True)
         # Break the reference cycle to help with garbage collection
         self._widget = None
+        # The cached bound methods would keep the destroyed widget alive
+        self._cache_widget_methods()
 
     def __notify_invoker_cb(self, palette, pspec):
         invoker = self.props.invoker
@@ -262,9 +269,6 @@ class Palette(PaletteWindow):
             immediate (bool): if True, hide instantly. If False, use animation.
             state: deprecated parameter, ignored.
         """
-        if immediate and self._widget:
-            if hasattr(self._widget, "get_preferred_size"):
-                self._widget.get_preferred_size()
         super().popdown(immediate)
 
     def on_enter(self):
@@ -274,6 +278,15 @@ class Palette(PaletteWindow):
         self._content = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
         self._secondary_box.append(self._content)
 
+    @property
+    def action_bar(self):
+        """The :class:`PaletteActionBar`, created on first access."""
+        if self._action_bar is None:
+            self._action_bar = PaletteActionBar(self)
+            self._secondary_box.append(self._action_bar)
+            self._full_request_dirty = True
+        return self._action_bar
+
     def _update_accel_widget(self):
         if (
             self.props.invoker is not None
@@ -287,11 +300,12 @@ class Palette(PaletteWindow):
     def set_primary_text(self, label, accel_path=None):
         self._primary_text = label
         if label is not None:
-            label = GLib.markup_escape_text(label)
-            self._label.set_markup(f"<b>{label}</b>")
+            self._label.set_text(label)
+            self._label.set_attributes(_BOLD_ATTRS)
             self._label.set_visible(True)
         else:
             self._label.set_visible(False)
+        self._full_request_dirty = True
 
     def get_primary_text(self):
         return self._primary_text
@@ -334,6 +348,7 @@ class Palette(PaletteWindow):
             self._secondary_text = label
             self._secondary_label.set_text(label)
             self._secondary_label.set_visible(True)
+        self._full_request_dirty = True
 
     def get_secondary_text(self):
         return self._secondary_text
@@ -370,6 +385,7 @@ class Palette(PaletteWindow):
             self._icon.props.pixel_size = style.STANDARD_ICON_SIZE
             event_box.append(self._icon)
             self._show_icon()
+        self._full_request_dirty = True
 
     def get_icon(self):
         return self._icon
@@ -386,6 +402,7 @@ class Palette(PaletteWindow):
             self._show_icon()
         else:
             self._hide_icon()
+        self._full_request_dirty = True
 
     def get_icon_visible(self):
         return self._icon_visible
@@ -432,6 +449,7 @@ class Palette(PaletteWindow):
                 self._content.set_visible(False)
 
         self._content_widget = widget
+        self._full_request_dirty = True
 
         self._update_accept_focus()
         self._update_separators()
@@ -466,15 +484,26 @@ class Palette(PaletteWindow):
             self._widget.set_accept_focus(accept_focus)
 
     def _update_full_request(self):
-        if self._widget is not None:
-            if hasattr(self._widget, "get_preferred_size"):
-                min_size, nat_size = self._widget.get_preferred_size()
-                self._full_request = [nat_size.width, nat_size.height]
-            else:
-                self._full_request = [
-                    style.GRID_CELL_SIZE * 3,
-                    style.GRID_CELL_SIZE * 2,
-                ]
+        if self._widget is None:
+            return self._full_request
+
+        # Changes made through a menu or content widget the caller holds
+        # do not set the flag, so an unmapped widget is measured again.
+        # GTK keeps its own measurements until a child queues a resize,
+        # so this is cheap when nothing changed.
+        if not self._full_request_dirty and self._widget.get_mapped():
+            return self._full_request
+
+        self._full_request_dirty = False
+        if hasattr(self._widget, "get_preferred_size"):
+            min_size, nat_size = self._widget.get_preferred_size()
+            self._full_request = [nat_size.width, nat_size.height]
+        else:
+            self._full_request = [
+                style.GRID_CELL_SIZE * 3,
+                style.GRID_CELL_SIZE * 2,
+            ]
+        return self._full_request
 
     def get_menu(self):
         assert self._content_widget is None
@@ -500,6 +529,8 @@ class Palette(PaletteWindow):
 
             self._setup_widget()
 
+        # Callers fetch the menu to add items to it
+        self._full_request_dirty = True
         return self._widget
 
     menu = GObject.Property(type=object, getter=get_menu)
@@ -510,9 +541,10 @@ class Palette(PaletteWindow):
 
 class PaletteActionBar(Gtk.Box):
 
-    def __init__(self):
+    def __init__(self, palette=None):
         # initializing with Horizontal box as this was a HButtonBox before
         super().__init__(orientation=Gtk.Orientation.HORIZONTAL)
+        self._palette = palette
         self.set_spacing(style.DEFAULT_SPACING)
         self.set_homogeneous(True)
         self.add_css_class("palette-action-bar")
@@ -529,4 +561,6 @@ class PaletteActionBar(Gtk.Box):
             button.set_child(box)
 
         self.append(button)
+        if self._palette is not None:
+            self._palette._full_request_dirty = True
         return button
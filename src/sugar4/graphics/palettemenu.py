@@ -51,7 +51,7 @@ Example:
 
                 menu_item = PaletteMenuItem(
                     _('Edit'), icon_name='toolbar-edit')
-                menu_item.connect('activate', self.__edit_cb)
+                menu_item.connect('item-activated', self.__edit_cb)
                 box.append_item(menu_item)
 
                 sep = PaletteMenuItemSeparator()
@@ -81,7 +81,7 @@ Example:
         palette.set_content(box)
 
         menu_item = PaletteMenuItem(_('Floating'))
-        menu_item.connect('activate', self.__image_cb, True)
+        menu_item.connect('item-activated', self.__image_cb, True)
         box.append_item(menu_item)
 """
 
@@ -89,12 +89,26 @@ import gi
 
 gi.require_version("Gtk", "4.0")
 
-from gi.repository import GObject, Gtk, Gdk
-import logging
+from gi.repository import GObject, Gtk
 
 from sugar4.graphics.icon import Icon
 from sugar4.graphics import style
 
+# Style metrics used for every menu item, resolved once at import
+_DEFAULT_SPACING = style.DEFAULT_SPACING
+_DEFAULT_PADDING = style.DEFAULT_PADDING
+_DEFAULT_PADDING_HALF = style.DEFAULT_PADDING // 2
+_SMALL_ICON_SIZE = style.SMALL_ICON_SIZE
+_ELLIPSIZE = style.ELLIPSIZE_MODE_DEFAULT
+
+# Gtk.Inscription is only available from GTK 4.8
+_HAS_INSCRIPTION = hasattr(Gtk, "Inscription")
+
+# Fixed PaletteMenuItem grid columns
+_ICON_COLUMN = 0
+_LABEL_COLUMN = 1
+_ACCELERATOR_COLUMN = 2
+
 
 class PaletteMenuBox(Gtk.Box):
     """
@@ -135,9 +149,7 @@ class PaletteMenuBox(Gtk.Box):
             None
         """
         item = None
-        if isinstance(item_or_widget, PaletteMenuItem) or isinstance(
-            item_or_widget, PaletteMenuItemSeparator
-        ):
+        if isinstance(item_or_widget, _MENU_ITEM_TYPES):
             item = item_or_widget
         else:
             item = self._wrap_widget(
@@ -146,26 +158,48 @@ class PaletteMenuBox(Gtk.Box):
 
         self.append(item)
 
-    def _wrap_widget(self, widget, horizontal_padding, vertical_padding):
-        """Wrap a widget with padding containers."""
-        vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+    def extend_items(self, items, horizontal_padding=None, vertical_padding=None):
+        """
+        Add several menu items, separators or other widgets to the end of
+        the palette, in order.
+
+        Property notifications of the box are held back until the whole
+        batch is appended.
+
+        Args:
+            items (iterable): items or widgets to add, as accepted by
+                :meth:`append_item`
+            horizontal_padding (int): padding applied to plain widgets
+            vertical_padding (int): padding applied to plain widgets
+
+        Returns:
+            None
+        """
+        # Hiding the box would unmap an open menu, which flickers and
+        # loses the focus
+        self.freeze_notify()
+        try:
+            for item in items:
+                self.append_item(item, horizontal_padding, vertical_padding)
+        finally:
+            self.thaw_notify()
 
+    def _wrap_widget(self, widget, horizontal_padding, vertical_padding):
+        """Wrap a widget in a padded container."""
         if horizontal_padding is None:
-            horizontal_padding = style.DEFAULT_SPACING
+            horizontal_padding = _DEFAULT_SPACING
 
         if vertical_padding is None:
-            vertical_padding = style.DEFAULT_SPACING
-
-        hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
-        hbox.set_margin_top(vertical_padding)
-        hbox.set_margin_bottom(vertical_padding)
-        vbox.append(hbox)
+            vertical_padding = _DEFAULT_SPACING
 
-        hbox.set_margin_start(horizontal_padding)
-        hbox.set_margin_end(horizontal_padding)
-        hbox.append(widget)
+        box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
+        box.set_margin_top(vertical_padding)
+        box.set_margin_bottom(vertical_padding)
+        box.set_margin_start(horizontal_padding)
+        box.set_margin_end(horizontal_padding)
+        box.append(widget)
 
-        return vbox
+        return box
 
 
 class PaletteMenuItemSeparator(Gtk.Separator):
@@ -178,26 +212,12 @@ class PaletteMenuItemSeparator(Gtk.Separator):
 
     def __init__(self):
         super().__init__(orientation=Gtk.Orientation.HORIZONTAL)
+        _apply_module_css()
 
         # Set minimum height for the separator
-        self.set_size_request(-1, style.DEFAULT_SPACING * 2)
+        self.set_size_request(-1, _DEFAULT_SPACING * 2)
 
         self.add_css_class("palette-menu-separator")
-        self._apply_separator_styling()
-
-    def _apply_separator_styling(self):
-        """Apply CSS styling for the separator."""
-        css = """
-        separator.palette-menu-separator {
-            margin: 2px 6px;
-            min-height: 1px;
-            background: alpha(@theme_fg_color, 0.2);
-        }
-        """
-        try:
-            style.apply_css_to_widget(self, css)
-        except Exception as e:
-            logging.warning(f"Could not apply separator CSS: {e}")
 
 
 class PaletteMenuItem(Gtk.Button):
@@ -205,8 +225,12 @@ class PaletteMenuItem(Gtk.Button):
     A palette menu item is a line of text, and optionally an icon, that the
     user can activate.
 
-    The `activate` signal is usually emitted when the item is clicked. It has
-    no arguments. When a menu item is activated, the palette is also closed.
+    The `item-activated` signal is emitted when the item is clicked or
+    activated from the keyboard. It has no arguments. When a menu item is
+    activated, the palette is also closed.
+
+    For compatibility, the `activate` signal is emitted once per
+    activation as well, but new code should use `item-activated`.
 
     This implementation replaces EventBox with Button for better accessibility
     and modern interaction patterns.
@@ -243,112 +267,91 @@ class PaletteMenuItem(Gtk.Button):
         accelerator=None,
     ):
         super().__init__()
+        _apply_module_css()
 
         self.icon = None
         self._accelerator_label = None
-
-        # main horizontal box
-        self._hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-        self._hbox.set_margin_start(style.DEFAULT_PADDING)
-        self._hbox.set_margin_end(style.DEFAULT_PADDING)
-        self._hbox.set_margin_top(style.DEFAULT_PADDING // 2)
-        self._hbox.set_margin_bottom(style.DEFAULT_PADDING // 2)
+        self._grid = None
+        self._keyboard_activated = False
+        self._emitting_activate = False
 
         # icon if specified
         if icon_name is not None:
-            self.icon = Icon(icon_name=icon_name, pixel_size=style.SMALL_ICON_SIZE)
+            self.icon = Icon(icon_name=icon_name, pixel_size=_SMALL_ICON_SIZE)
             if xo_color is not None:
                 self.icon.set_xo_color(xo_color)
-            self._hbox.append(self.icon)
+            self._get_grid().attach(self.icon, _ICON_COLUMN, 0, 1, 1)
         elif file_name is not None:
-            self.icon = Icon(file_name=file_name, pixel_size=style.SMALL_ICON_SIZE)
+            self.icon = Icon(file_name=file_name, pixel_size=_SMALL_ICON_SIZE)
             if xo_color is not None:
                 self.icon.set_xo_color(xo_color)
-            self._hbox.append(self.icon)
+            self._get_grid().attach(self.icon, _ICON_COLUMN, 0, 1, 1)
 
         if text_label is not None:
-            self.label = Gtk.Label(label=text_label)
-            self.label.set_halign(Gtk.Align.START)
-            self.label.set_hexpand(True)
+            if text_maxlen > 0:
+                self.label = Gtk.Label(
+                    label=text_label,
+                    halign=Gtk.Align.START,
+                    hexpand=True,
+                    max_width_chars=text_maxlen,
+                    ellipsize=_ELLIPSIZE,
+                )
+            else:
+                self.label = Gtk.Label(
+                    label=text_label, halign=Gtk.Align.START, hexpand=True
+                )
             # Force black text
             # TODO: Can also not do this based on feedback
             self.label.add_css_class("force-black")
-            from sugar4.graphics import style as _style
 
-            _style.apply_css_to_widget(self.label, ".force-black { color: #000000; }")
-
-            if text_maxlen > 0:
-                self.label.set_max_width_chars(text_maxlen)
-                self.label.set_ellipsize(style.ELLIPSIZE_MODE_DEFAULT)
-
-            self._hbox.append(self.label)
+            self._get_grid().attach(self.label, _LABEL_COLUMN, 0, 1, 1)
         else:
             self.label = None
 
         if accelerator is not None:
             self.set_accelerator(accelerator)
 
-        self.set_child(self._hbox)
-
         self.add_css_class("palette-menu-item")
-        self._apply_menu_item_styling()
-
-        # gesture controllers for hover effects
-        self._setup_gestures()
-
-        # Connect to activate signal
-        self.connect("activate", self._clicked_cb)
 
-    def _on_activate(self, button):
-        """Handle button activation - emits our custom signal."""
-        # this has been done to remove the conflict with Gtk.Button's activate
+        # Gtk.Button emits clicked for both pointer and keyboard activation
+        self.connect("clicked", self.__clicked_cb)
+
+    def _get_grid(self):
+        """Return the main single row grid, creating it on first use."""
+        if self._grid is None:
+            self._grid = Gtk.Grid(
+                column_spacing=6,
+                margin_start=_DEFAULT_PADDING,
+                margin_end=_DEFAULT_PADDING,
+                margin_top=_DEFAULT_PADDING_HALF,
+                margin_bottom=_DEFAULT_PADDING_HALF,
+            )
+            self.set_child(self._grid)
+        return self._grid
+
+    def do_activate(self):
+        if self._emitting_activate:
+            # Emitted by __clicked_cb for compatibility, already clicked
+            return
+        # Keyboard activation, Gtk.Button emits clicked once realized
+        self._keyboard_activated = self.get_realized()
+        Gtk.Button.do_activate(self)
+
+    def __clicked_cb(self, button):
+        # item-activated avoids clashing with Gtk.Button's own activate
         self.emit("item-activated")
 
-    def _apply_menu_item_styling(self):
-        """Apply CSS styling to make button look like a menu item."""
-        css = """
-        button.palette-menu-item {
-            background: transparent;
-            border: none;
-            border-radius: 4px;
-            padding: 0;
-        }
-        button.palette-menu-item:hover {
-            background: alpha(@theme_selected_bg_color, 0.1);
-        }
-        button.palette-menu-item:active {
-            background: alpha(@theme_selected_bg_color, 0.2);
-        }
-        button.palette-menu-item:disabled {
-            opacity: 0.5;
-        }
-        """
+        if self._keyboard_activated:
+            # activate handlers already ran for the key press
+            self._keyboard_activated = False
+            return
+
+        # Older code connects to activate, keep it firing on clicks
+        self._emitting_activate = True
         try:
-            style.apply_css_to_widget(self, css)
-        except Exception as e:
-            logging.warning(f"Could not apply menu item CSS: {e}")
-
-    def _setup_gestures(self):
-        """Set up gesture controllers for hover effects."""
-        # Mouse enter/leave events
-        motion_controller = Gtk.EventControllerMotion()
-        motion_controller.connect("enter", self._on_enter_notify)
-        motion_controller.connect("leave", self._on_leave_notify)
-        self.add_controller(motion_controller)
-
-    def _clicked_cb(self, button):
-        """Handle button click and emit activate signal."""
-        self.emit("activate")
-
-    def _on_enter_notify(self, controller, x, y):
-        """Handle mouse enter event."""
-        # TODO: Add Hover Effect
-        pass
-
-    def _on_leave_notify(self, controller):
-        """Handle mouse leave event."""
-        # TODO: Add hover Effect
-        pass
+            self.emit("activate")
+        finally:
+            self._emitting_activate = False
 
     def set_label(self, text_label):
         # Overriding parameter here!
@@ -380,12 +383,12 @@ class PaletteMenuItem(Gtk.Button):
             icon (Icon): Icon widget to display
         """
         if self.icon:
-            self._hbox.remove(self.icon)
+            self._grid.remove(self.icon)
 
         self.icon = icon
         if icon:
-            # Insert icon at the beginning
-            self._hbox.prepend(icon)
+            # The icon has its own column, siblings are left untouched
+            self._get_grid().attach(icon, _ICON_COLUMN, 0, 1, 1)
 
     def set_accelerator(self, text):
         """
@@ -394,22 +397,37 @@ class PaletteMenuItem(Gtk.Button):
         Args:
             text (str): Accelerator text to display (e.g., "Ctrl+S")
         """
+        if not text:
+            if self._accelerator_label:
+                self._grid.remove(self._accelerator_label)
+                self._accelerator_label = None
+            return
+
         if self._accelerator_label:
-            self._hbox.remove(self._accelerator_label)
-            self._accelerator_label = None
-
-        if text:
-            self._accelerator_label = Gtk.Label(label=text)
-            self._accelerator_label.set_halign(Gtk.Align.END)
-            self._accelerator_label.add_css_class("dim-label")
-            # Force black text for accelerator label
-            self._accelerator_label.add_css_class("force-black")
-            from sugar4.graphics import style as _style
-
-            _style.apply_css_to_widget(
-                self._accelerator_label, ".force-black { color: #000000; }"
+            if self._accelerator_label.get_text() != text:
+                self._accelerator_label.set_text(text)
+                if _HAS_INSCRIPTION:
+                    self._accelerator_label.set_nat_chars(max(12, len(text)))
+            return
+
+        if _HAS_INSCRIPTION:
+            # Size from the character count instead of measuring the text,
+            # but never narrower than the accelerator itself
+            self._accelerator_label = Gtk.Inscription(
+                text=text,
+                min_chars=8,
+                nat_chars=max(12, len(text)),
+                xalign=1.0,
+                halign=Gtk.Align.END,
+                css_classes=["dim-label"],
             )
-            self._hbox.append(self._accelerator_label)
+        else:
+            self._accelerator_label = Gtk.Label(
+                label=text, halign=Gtk.Align.END, css_classes=["dim-label"]
+            )
+        # Force black text for accelerator label
+        self._accelerator_label.add_css_class("force-black")
+        self._get_grid().attach(self._accelerator_label, _ACCELERATOR_COLUMN, 0, 1, 1)
 
     def set_sensitive(self, sensitive):
         """
@@ -418,6 +436,13 @@ class PaletteMenuItem(Gtk.Button):
         Args:
             sensitive (bool): Whether the item should be sensitive
         """
+        sensitive = bool(sensitive)
+        if (
+            self.get_sensitive() == sensitive
+            and self.has_css_class("disabled") != sensitive
+        ):
+            return
+
         super().set_sensitive(sensitive)
 
         if sensitive:
@@ -426,6 +451,10 @@ class PaletteMenuItem(Gtk.Button):
             self.add_css_class("disabled")
 
 
+# Widgets that handle their own padding in a PaletteMenuBox
+_MENU_ITEM_TYPES = (PaletteMenuItem, PaletteMenuItemSeparator)
+
+
 # Convenience functions for creating common menu items
 
 
@@ -446,7 +475,7 @@ def create_menu_item(text, icon_name=None, callback=None, accelerator=None):
         text_label=text, icon_name=icon_name, accelerator=accelerator
     )
     if callback:
-        item.connect("activate", callback)
+        item.connect("item-activated", callback)
     return item
 
 
@@ -486,6 +515,8 @@ class PaletteMenuGroup:
     A group of related menu items that can be managed together.
     """
 
+    __slots__ = ("name", "items")
+
     def __init__(self, name=None):
         self.name = name
         self.items = []
@@ -494,15 +525,23 @@ class PaletteMenuGroup:
         """Add an item to this group."""
         self.items.append(item)
 
+    def add_items(self, items):
+        """Add several items to this group at once."""
+        self.items.extend(items)
+
     def set_sensitive(self, sensitive):
         """Set sensitivity of all items in the group."""
+        sensitive = bool(sensitive)
         for item in self.items:
-            item.set_sensitive(sensitive)
+            if item.get_sensitive() != sensitive:
+                item.set_sensitive(sensitive)
 
     def set_visible(self, visible):
         """Set visibility of all items in the group."""
+        visible = bool(visible)
         for item in self.items:
-            item.set_visible(visible)
+            if item.get_visible() != visible:
+                item.set_visible(visible)
 
 
 class PaletteMenuBuilder:
@@ -510,6 +549,8 @@ class PaletteMenuBuilder:
     Builder class for creating complex palette menus.
     """
 
+    __slots__ = ("menu_box", "groups")
+
     def __init__(self):
         self.menu_box = PaletteMenuBox()
         self.groups = {}
@@ -520,13 +561,49 @@ class PaletteMenuBuilder:
         """Add a menu item to the builder."""
         item = create_menu_item(text, icon_name, callback, accelerator)
         self.menu_box.append_item(item)
+        self._add_to_group(item, group)
+        return item
 
-        if group:
-            if group not in self.groups:
-                self.groups[group] = PaletteMenuGroup(group)
-            self.groups[group].add_item(item)
+    def add_items(self, specs):
+        """
+        Add several menu items to the builder at once.
 
-        return item
+        The items are all created before being appended to the menu box
+        in a single batch.
+
+        Args:
+            specs (iterable): dicts of keyword arguments accepted by
+                :meth:`add_item`
+
+        Returns:
+            list: the created menu items
+        """
+        items = []
+        grouped_items = {}
+        for spec in specs:
+            spec = dict(spec)
+            group = spec.pop("group", None)
+            item = create_menu_item(**spec)
+            if group:
+                grouped_items.setdefault(group, []).append(item)
+            items.append(item)
+
+        # Grow each group once for the whole batch
+        for group, group_items in grouped_items.items():
+            self._get_or_create_group(group).add_items(group_items)
+
+        self.menu_box.extend_items(items)
+        return items
+
+    def _get_or_create_group(self, group):
+        menu_group = self.groups.get(group)
+        if menu_group is None:
+            menu_group = self.groups[group] = PaletteMenuGroup(group)
+        return menu_group
+
+    def _add_to_group(self, item, group):
+        if group:
+            self._get_or_create_group(group).add_item(item)
 
     def add_separator(self):
         """Add a separator to the builder."""
@@ -541,3 +618,43 @@ class PaletteMenuBuilder:
     def get_group(self, name):
         """Get a menu group by name."""
         return self.groups.get(name)
+
+
+_module_css_applied = False
+
+
+def _apply_module_css():
+    """Apply module-level CSS styling for palette menu items, once."""
+    global _module_css_applied
+    if _module_css_applied:
+        return
+
+    css = """
+    .force-black {
+        color: #000000;
+    }
+
+    separator.palette-menu-separator {
+        margin: 2px 6px;
+        min-height: 1px;
+        background: alpha(@theme_fg_color, 0.2);
+    }
+
+    button.palette-menu-item {
+        background: transparent;
+        border: none;
+        border-radius: 4px;
+        padding: 0;
+    }
+    button.palette-menu-item:hover {
+        background: alpha(@theme_selected_bg_color, 0.1);
+    }
+    button.palette-menu-item:active {
+        background: alpha(@theme_selected_bg_color, 0.2);
+    }
+    button.palette-menu-item:disabled {
+        opacity: 0.5;
+    }
+    """
+
+    _module_css_applied = style.apply_css_to_display(css)
@@ -21,80 +21,129 @@
 # Boston, MA 02111-1307, USA.
 
 
+import functools
 import logging
 
 import gi
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("Gdk", "4.0")
+gi.require_version("Graphene", "1.0")
 
-from gi.repository import Gdk, Gtk, GObject, GLib
+from gi.repository import Gdk, Gtk, GObject, GLib, Graphene
 
 from sugar4.graphics import palettegroup
-from sugar4.graphics import animator
 from sugar4.graphics import style
 from sugar4.graphics.icon import CellRendererIcon
 from sugar4.debug import debug_print
 
+logger = logging.getLogger(__name__)
 
 _pointer = None
 
+# Unbound GI methods used on the pointer query path, resolved once
+_widget_get_native = Gtk.Widget.get_native
+_native_get_surface = Gtk.Native.get_surface
+_surface_get_device_position = Gdk.Surface.get_device_position
+
+# GI attributes referenced from event-rate handlers, resolved once
+_PT_BOTTOM = Gtk.PositionType.BOTTOM
+_PT_RIGHT = Gtk.PositionType.RIGHT
+_PT_LEFT = Gtk.PositionType.LEFT
+_PT_TOP = Gtk.PositionType.TOP
+_GdkRectangle = Gdk.Rectangle
+_KEY_ESCAPE = Gdk.KEY_Escape
+_glib_timeout_add = GLib.timeout_add
+_glib_source_remove = GLib.source_remove
+_SOURCE_REMOVE = GLib.SOURCE_REMOVE
+_ORIGIN = Graphene.Point().init(0, 0)
+
 # Route all palette debug output through the centralized helper so that it
 # honours the SUGAR_DEBUG flag without sprinkling conditionals everywhere.
+# The flag is checked on every call, so it can be turned on at runtime.
 print = debug_print
 
 
+# Pointer positions queried during the current main loop dispatch, keyed
+# by widget. A high priority idle empties it before the next dispatch, so
+# repeated queries while positioning one popup share a single GDK call.
+_pointer_cache = {}
+_pointer_cache_idle_id = None
+
+
+def _clear_pointer_cache():
+    global _pointer_cache_idle_id
+    _pointer_cache_idle_id = None
+    _pointer_cache.clear()
+    return _SOURCE_REMOVE
+
+
 def _get_pointer_position(widget):
     """Get pointer position relative to widget ."""
+    global _pointer_cache_idle_id
+    position = _pointer_cache.get(widget)
+    if position is None:
+        position = _query_pointer_position(widget)
+        _pointer_cache[widget] = position
+        if _pointer_cache_idle_id is None:
+            _pointer_cache_idle_id = GLib.idle_add(
+                _clear_pointer_cache, priority=GLib.PRIORITY_HIGH
+            )
+    return position
+
+
+def _query_pointer_position(widget):
     global _pointer
     if _pointer is None:
-        display = widget.get_display()
-        seat = display.get_default_seat()
+        seat = widget.get_display().get_default_seat()
+        if seat is None:
+            return (0, 0)
         _pointer = seat.get_pointer()
+        if _pointer is None:
+            return (0, 0)
 
-    native = widget.get_native()
+    native = _widget_get_native(widget)
     if not native:
         return (0, 0)
 
-    surface = native.get_surface()
+    surface = _native_get_surface(native)
     if not surface:
         return (0, 0)
 
-    try:
-        device_position = surface.get_device_position(_pointer)
-        return (device_position[1], device_position[2])  # x, y
-    except Exception:
-        return (0, 0)
+    # Cannot fail once both the pointer and the surface are known
+    _, x, y, _ = _surface_get_device_position(surface, _pointer)
+    return (x, y)
+
+
+# Gap sides in the order they are tested by _calculate_gap
+_GAP_SIDES = (_PT_BOTTOM, _PT_RIGHT, _PT_LEFT, _PT_TOP)
 
 
 def _calculate_gap(a, b):
     """Helper function to find the gap position and size of widget a"""
-    gap = True
-
-    if a.y + a.height == b.y:
-        gap_side = Gtk.PositionType.BOTTOM
-    elif a.x + a.width == b.x:
-        gap_side = Gtk.PositionType.RIGHT
-    elif a.x == b.x + b.width:
-        gap_side = Gtk.PositionType.LEFT
-    elif a.y == b.y + b.height:
-        gap_side = Gtk.PositionType.TOP
-    else:
-        gap = False
-
-    if gap:
-        if gap_side == Gtk.PositionType.BOTTOM or gap_side == Gtk.PositionType.TOP:
-            gap_start = min(a.width, max(0, b.x - a.x))
-            gap_size = max(0, min(a.width, (b.x + b.width) - a.x) - gap_start)
-        elif gap_side == Gtk.PositionType.RIGHT or gap_side == Gtk.PositionType.LEFT:
-            gap_start = min(a.height, max(0, b.y - a.y))
-            gap_size = max(0, min(a.height, (b.y + b.height) - a.y) - gap_start)
-
-    if gap and gap_size > 0:
-        return (gap_side, gap_start, gap_size)
-    else:
+    edge_match = (
+        a.y + a.height == b.y,
+        a.x + a.width == b.x,
+        a.x == b.x + b.width,
+        a.y == b.y + b.height,
+    )
+    if True not in edge_match:
         return False
 
+    side = edge_match.index(True)
+    if side == 0 or side == 3:
+        # Gap on the bottom or top edge
+        gap_start = min(a.width, max(0, b.x - a.x))
+        gap_size = min(a.width, b.x + b.width - a.x) - gap_start
+    else:
+        # Gap on the right or left edge
+        gap_start = min(a.height, max(0, b.y - a.y))
+        gap_size = min(a.height, b.y + b.height - a.y) - gap_start
+
+    if gap_size > 0:
+        return (_GAP_SIDES[side], gap_start, gap_size)
+    return False
+
 
 class _PaletteMenuWidget(Gtk.Popover):
     """Palette menu widget using Popover."""
@@ -113,6 +162,8 @@ class _PaletteMenuWidget(Gtk.Popover):
         self._menu_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
         self._menu_box.set_spacing(2)
         self.set_child(self._menu_box)
+        self._children = []
+        self._total_height_cache = None
 
         self._popup_position = (0, 0)
         self._entered = False
@@ -120,6 +171,8 @@ class _PaletteMenuWidget(Gtk.Popover):
         self._mouse_in_invoker = False
         self._up = False
         self._invoker = None
+        self._motion_pending = False
+        self._cached_invoker_rect = None
 
         # Set up event controllers
         self._motion_controller = Gtk.EventControllerMotion()
@@ -135,19 +188,27 @@ class _PaletteMenuWidget(Gtk.Popover):
     def append(self, menu_item):
         """Add a menu item to the menu."""
         self._menu_box.append(menu_item)
+        self._children.append(menu_item)
+        menu_item.connect("notify::visible", self.__child_visible_cb)
+        self._total_height_cache = None
 
     def remove(self, menu_item):
         """Remove a menu item from the menu."""
         self._menu_box.remove(menu_item)
+        self._children.remove(menu_item)
+        menu_item.disconnect_by_func(self.__child_visible_cb)
+        self._total_height_cache = None
+
+    def __child_visible_cb(self, menu_item, pspec):
+        self._total_height_cache = None
 
     def get_children(self):
-        """Get all menu items."""
-        children = []
-        child = self._menu_box.get_first_child()
-        while child:
-            children.append(child)
-            child = child.get_next_sibling()
-        return children
+        """Get all menu items.
+
+        Served from the list kept by append() and remove(), so no
+        widget tree walk or observe_children() model is involved.
+        """
+        return list(self._children)
 
     def set_accept_focus(self, focus):
         """Set whether the menu accepts focus."""
@@ -170,6 +231,21 @@ class _PaletteMenuWidget(Gtk.Popover):
     def set_invoker(self, invoker):
         """Set the invoker widget."""
         self._invoker = invoker
+        self._cached_invoker_rect = None
+
+    def _update_invoker_rect(self):
+        """Cache the invoker rectangle bounds for pointer hit tests."""
+        rect = self._invoker.get_rect()
+        self._cached_invoker_rect = rect
+        self._rx0 = rect.x
+        self._rx1 = rect.x + rect.width
+        self._ry0 = rect.y
+        self._ry1 = rect.y + rect.height
+
+    def _in_invoker(self, root_x, root_y):
+        if self._cached_invoker_rect is None:
+            self._update_invoker_rect()
+        return self._rx0 <= root_x < self._rx1 and self._ry0 <= root_y < self._ry1
 
     def popup(self, invoker=None):
         """Show the menu."""
@@ -183,6 +259,9 @@ class _PaletteMenuWidget(Gtk.Popover):
         self._entered = False
         self._mouse_in_palette = False
         self._mouse_in_invoker = False
+        self._cached_invoker_rect = None
+        if self._invoker:
+            self._update_invoker_rect()
 
         super().popup()
         self._up = True
@@ -194,6 +273,7 @@ class _PaletteMenuWidget(Gtk.Popover):
 
         super().popdown()
         self._up = False
+        self._cached_invoker_rect = None
 
     # https://docs.gtk.org/gtk4/signal.EventControllerMotion.enter.html
     def _enter_notify_cb(self, controller, x, y):
@@ -208,76 +288,69 @@ class _PaletteMenuWidget(Gtk.Popover):
 
     def _motion_notify_cb(self, controller, x, y):
         """Handle motion notify events."""
-        if not self._invoker:
+        if not self._invoker or self._motion_pending:
             return
 
-        # Convert coordinates to root window coordinates
-        try:
-            native = self.get_native()
-            if native and native.get_surface():
-                surface = native.get_surface()
-                device_position = surface.get_device_position(_pointer)  # type: ignore
-                root_x, root_y = device_position[1], device_position[2]
-            else:
-                return
-        except Exception:
-            return
+        # Only the invoker boundary matters, so read the pointer once per
+        # frame rather than for every (possibly uncoalesced) motion event.
+        self._motion_pending = True
+        self.add_tick_callback(self._process_motion_tick)
 
-        rect = self._invoker.get_rect()
-        in_invoker = (
-            root_x >= rect.x
-            and root_x < (rect.x + rect.width)
-            and root_y >= rect.y
-            and root_y < (rect.y + rect.height)
-        )
+    def _process_motion_tick(self, widget, frame_clock):
+        """Check whether the pointer is over the invoker, once per frame."""
+        self._motion_pending = False
+        if not self._invoker:
+            return _SOURCE_REMOVE
+
+        # Without a surface there is no pointer position to compare
+        native = _widget_get_native(self)
+        if not native or not _native_get_surface(native):
+            return _SOURCE_REMOVE
+
+        root_x, root_y = _get_pointer_position(self)
+
+        in_invoker = self._in_invoker(root_x, root_y)
 
         if in_invoker != self._mouse_in_invoker:
             self._mouse_in_invoker = in_invoker
             self._reevaluate_state()
 
+        return _SOURCE_REMOVE
+
     def _button_release_cb(self, gesture, n_press, x, y):
         """Handle button release events."""
         if not self._invoker:
             return False
 
-        # Check if click is in invoker area
-        try:
-            native = self.get_native()
-            if native and native.get_surface():
-                surface = native.get_surface()
-                device_position = surface.get_device_position(_pointer)  # type: ignore
-                root_x, root_y = device_position[1], device_position[2]
-            else:
-                return False
-        except Exception:
-            return False
+        # Whether the click is in the invoker area was already decided by
+        # the last motion tick
+        return self._mouse_in_invoker
 
-        rect = self._invoker.get_rect()
-        in_invoker = (
-            root_x >= rect.x
-            and root_x < (rect.x + rect.width)
-            and root_y >= rect.y
-            and root_y < (rect.y + rect.height)
-        )
+    def _notify_enter(self):
+        self._entered = True
+        self.emit("enter-notify")
 
-        return in_invoker
+    def _notify_leave(self):
+        self._entered = False
+        self.emit("leave-notify")
+
+    # Indexed by [entered][(mouse_in_palette << 1) | mouse_in_invoker].
+    # If we previously advised that the mouse had left, but now the mouse
+    # is inside either the palette or the invoker, notify that it entered.
+    # If we previously advised that the mouse was inside, but now it is
+    # outside both the invoker and the palette, notify that it left.
+    _TRANSITIONS = (
+        (None, _notify_enter, _notify_enter, _notify_enter),
+        (_notify_leave, None, None, None),
+    )
 
     def _reevaluate_state(self):
         """Reevaluate mouse state and emit appropriate signals."""
-        if self._entered:
-            # If we previously advised that the mouse was inside, but now the
-            # mouse is outside both the invoker and the palette, notify that
-            # the mouse has left.
-            if not self._mouse_in_palette and not self._mouse_in_invoker:
-                self._entered = False
-                self.emit("leave-notify")
-        else:
-            # If we previously advised that the mouse had left, but now the
-            # mouse is inside either the palette or the invoker, notify that
-            # the mouse has entered.
-            if self._mouse_in_palette or self._mouse_in_invoker:
-                self._entered = True
-                self.emit("enter-notify")
+        action = self._TRANSITIONS[self._entered][
+            (self._mouse_in_palette << 1) | self._mouse_in_invoker
+        ]
+        if action is not None:
+            action(self)
 
 
 class _PaletteWindowWidget(Gtk.Window):
@@ -342,29 +415,25 @@ class _PaletteWindowWidget(Gtk.Window):
         """Allocate size to the palette window and its children."""
         Gtk.Window.do_size_allocate(self, width, height, baseline)
 
-        allocation = Gdk.Rectangle()
-        allocation.x = 0
-        allocation.y = 0
-        allocation.width = width
-        allocation.height = height
-
-        if (
-            self._old_alloc is None
-            or self._old_alloc.x != allocation.x
-            or self._old_alloc.y != allocation.y
-            or self._old_alloc.width != allocation.width
-            or self._old_alloc.height != allocation.height
-        ):
+        allocation = (0, 0, width, height)
+        if allocation != self._old_alloc:
             self.queue_draw()
-
-        self._old_alloc = allocation
+            self._old_alloc = allocation
 
     def set_invoker(self, invoker):
         self._invoker = invoker
 
     def get_rect(self):
         """Get the rectangle occupied by this window."""
-        rect = Gdk.Rectangle()
+        rect = _GdkRectangle()
+        ok, bounds = self.compute_bounds(self)
+        if ok:
+            rect.x = int(bounds.origin.x)
+            rect.y = int(bounds.origin.y)
+            rect.width = int(bounds.size.width)
+            rect.height = int(bounds.size.height)
+            return rect
+
         rect.x = 0  # GTK4: Position managed by compositor
         rect.y = 0
         rect.width = self.get_width()
@@ -426,41 +495,60 @@ class MouseSpeedDetector(GObject.GObject):
         self._delay = delay
         self._state = None
         self._timeout_hid = None
-        self._mouse_pos = None
+        self._tick_pos = None
+        self._motion_controller = None
+        self._motion_widget = None
 
     def start(self):
         """Start detecting mouse speed."""
         self.stop()
 
         if self.parent:
-            self._mouse_pos = _get_pointer_position(self.parent)
-            self._timeout_hid = GLib.timeout_add(self._delay, self._timer_cb)
+            self._motion_controller = Gtk.EventControllerMotion()
+            self._motion_controller.connect("motion", self._motion_cb)
+            self.parent.add_controller(self._motion_controller)
+            self._motion_widget = self.parent
+
+            # Arm a first tick so a parked pointer still reports motion-slow,
+            # later ticks are armed by pointer motion or by a fast tick
+            self._tick_pos = _get_pointer_position(self.parent)
+            self._timeout_hid = _glib_timeout_add(self._delay, self._timer_cb)
 
     def stop(self):
         """Stop detecting mouse speed."""
         if self._timeout_hid is not None:
-            GLib.source_remove(self._timeout_hid)
+            _glib_source_remove(self._timeout_hid)
             self._timeout_hid = None
+        if self._motion_controller is not None:
+            self._motion_widget.remove_controller(self._motion_controller)
+            self._motion_controller = None
+            self._motion_widget = None
         self._state = None
 
-    def _detect_motion(self):
-        """Detect if the mouse has moved significantly."""
-        if not self.parent or not self._mouse_pos:
-            return False
+    def _motion_cb(self, controller, x, y):
+        """Arm a one-shot tick on pointer motion if none is pending."""
+        if self._timeout_hid is None:
+            self._timeout_hid = _glib_timeout_add(self._delay, self._timer_cb)
 
-        oldx, oldy = self._mouse_pos
-        try:
-            x, y = _get_pointer_position(self.parent)
-        except Exception:
+    def _detect_motion(self):
+        """Detect if the mouse has moved significantly since the last tick."""
+        if not self.parent or self._tick_pos is None:
             return False
 
-        self._mouse_pos = (x, y)
+        # Same coordinate space as the position recorded in start()
+        oldx, oldy = self._tick_pos
+        x, y = _get_pointer_position(self.parent)
+        self._tick_pos = (x, y)
 
-        dist2 = (oldx - x) ** 2 + (oldy - y) ** 2
-        return dist2 > self._threshold**2
+        # Manhattan distance is close enough to tell slow from fast motion
+        dx = oldx - x
+        dy = oldy - y
+        return (dx if dx >= 0 else -dx) + (dy if dy >= 0 else -dy) > self._threshold
 
     def _timer_cb(self):
-        """Timer callback to check mouse motion."""
+        """One-shot tick to check mouse motion."""
+        self._timeout_hid = None
+
         motion = self._detect_motion()
         if motion and self._state != self._MOTION_FAST:
             self.emit("motion-fast")
@@ -469,7 +557,11 @@ class MouseSpeedDetector(GObject.GObject):
             self.emit("motion-slow")
             self._state = self._MOTION_SLOW
 
-        return GLib.SOURCE_CONTINUE
+        if motion:
+            # The pointer may stop without another motion event, tick again
+            # so the state can still drop back to slow
+            self._timeout_hid = _glib_timeout_add(self._delay, self._timer_cb)
+        return _SOURCE_REMOVE
 
 
 class PaletteWindow(GObject.GObject):
@@ -491,19 +583,42 @@ class PaletteWindow(GObject.GObject):
         self._alignment = None
         self._up = False
         self._widget = None
+        self._last_position = None
+        self._pending_invoker_enter = None
+        self._invoker_idle_id = None
+        self._cache_widget_methods()
+        self._cache_invoker_methods()
 
-        self._popup_anim = animator.Animator(0.5, 10)
-        self._popup_anim.add(_PopupAnimation(self))
-
-        self._popdown_anim = animator.Animator(0.6, 10)
-        self._popdown_anim.add(_PopdownAnimation(self))
+        self._popup_anim = _PopupAnimation(self)
+        self._popdown_anim = _PopdownAnimation(self)
 
         self.set_group_id("default")
 
         self._mouse_detector = MouseSpeedDetector(200, 5)
 
+    def _cache_widget_methods(self):
+        """Probe the optional widget methods once per widget."""
+        widget = self._widget
+        self._widget_move = getattr(widget, "move", None)
+        self._widget_popup = getattr(widget, "popup", None)
+        self._widget_popdown = getattr(widget, "popdown", None)
+        self._widget_get_rect = getattr(widget, "get_rect", None)
+        self._widget_set_invoker = getattr(widget, "set_invoker", None)
+        self._widget_set_transient_for = getattr(widget, "set_transient_for", None)
+        self._widget_get_preferred_size = getattr(widget, "get_preferred_size", None)
+
+    def _cache_invoker_methods(self):
+        """Probe the optional invoker methods once per invoker."""
+        invoker = self._invoker
+        self._invoker_get_alignment = getattr(invoker, "get_alignment", None)
+        self._invoker_get_toplevel = getattr(invoker, "get_toplevel", None)
+        self._invoker_notify_popup = getattr(invoker, "notify_popup", None)
+        self._invoker_notify_popdown = getattr(invoker, "notify_popdown", None)
+
     def _setup_widget(self):
         """Set up the widget with necessary connections."""
+        self._cache_widget_methods()
+        self._last_position = None
         if self._widget is not None:
             self._widget.connect("realize", self.__realize_cb)
             self._widget.connect("unrealize", self.__unrealize_cb)
@@ -518,8 +633,8 @@ class PaletteWindow(GObject.GObject):
             self._widget.add_controller(self._key_controller)
 
         self._set_effective_group_id(self._group_id)
-        if self._widget is not None and hasattr(self._widget, "set_invoker"):
-            self._widget.set_invoker(self._invoker)
+        if self._widget_set_invoker is not None:
+            self._widget_set_invoker(self._invoker)
 
         self._mouse_detector.connect("motion-slow", self._mouse_slow_cb)
         self._mouse_detector.parent = self._widget
@@ -561,14 +676,21 @@ class PaletteWindow(GObject.GObject):
         pass
 
     def set_invoker(self, invoker):
-        for hid in self._invoker_hids[:]:
-            if self._invoker:
+        if self._invoker_idle_id is not None:
+            _glib_source_remove(self._invoker_idle_id)
+            self._invoker_idle_id = None
+            self._pending_invoker_enter = None
+
+        if self._invoker:
+            for hid in self._invoker_hids:
                 self._invoker.disconnect(hid)
-            self._invoker_hids.remove(hid)
+        self._invoker_hids.clear()
 
         self._invoker = invoker
-        if self._widget is not None and hasattr(self._widget, "set_invoker"):
-            self._widget.set_invoker(invoker)
+        self._last_position = None
+        self._cache_invoker_methods()
+        if self._widget is not None and self._widget_set_invoker is not None:
+            self._widget_set_invoker(invoker)
 
         if invoker is not None:
             self._invoker_hids.append(
@@ -649,8 +771,8 @@ class PaletteWindow(GObject.GObject):
 
         # Get size request
         try:
-            if hasattr(self._widget, "get_preferred_size"):
-                minimum, natural = self._widget.get_preferred_size()  # type: ignore
+            if self._widget_get_preferred_size is not None:
+                minimum, natural = self._widget_get_preferred_size()
                 req = natural
             else:
                 req = Gdk.Rectangle()
@@ -661,63 +783,74 @@ class PaletteWindow(GObject.GObject):
             req.width = style.GRID_CELL_SIZE * 3
             req.height = style.GRID_CELL_SIZE * 2
 
-        # Handle menu widget size calculation
+        # Handle menu widget size calculation, the sum of the children
+        # heights is kept until the menu items change
         if isinstance(self._widget, _PaletteMenuWidget):
-            total_height = 0
-            for child in self._widget.get_children():  # type: ignore
-                try:
-                    if hasattr(child, "get_preferred_size"):
-                        minimum, natural = child.get_preferred_size()
-                        total_height += natural.height
-                    else:
+            total_height = self._widget._total_height_cache
+            if total_height is None:
+                total_height = 0
+                for child in self._widget._children:
+                    try:
+                        if hasattr(child, "get_preferred_size"):
+                            minimum, natural = child.get_preferred_size()
+                            total_height += natural.height
+                        else:
+                            total_height += style.GRID_CELL_SIZE
+                    except Exception:
                         total_height += style.GRID_CELL_SIZE
-                except Exception:
-                    total_height += style.GRID_CELL_SIZE
 
-            # Add border width
-            line_width = 2
-            total_height += line_width * 2
+                # Add border width
+                line_width = 2
+                total_height += line_width * 2
+                self._widget._total_height_cache = total_height
             req.height = total_height
 
         position = invoker.get_position_for_alignment(self._alignment, req)
         if position is None:
             position = invoker.get_position(req)
 
-        if hasattr(self._widget, "move"):
-            self._widget.move(position.x, position.y)
+        # Moving the widget again to the same place is the costly part
+        xy = (position.x, position.y)
+        if xy == self._last_position:
+            return
+        self._last_position = xy
+
+        if self._widget_move is not None:
+            self._widget_move(position.x, position.y)
 
     def get_full_size_request(self):
         """Get the full size request for the palette."""
-        if self._widget and hasattr(self._widget, "get_preferred_size"):
+        if self._widget and self._widget_get_preferred_size is not None:
             try:
-                return self._widget.get_preferred_size()[1]  # natural size
+                return self._widget_get_preferred_size()[1]  # natural size
             except Exception:
                 pass
 
         # Fallback
-        req = Gdk.Rectangle()
+        req = _GdkRectangle()
         req.width = style.GRID_CELL_SIZE * 3
         req.height = style.GRID_CELL_SIZE * 2
         return req
 
     def popup(self, immediate=False):
         """Show the palette."""
-        print(f"PaletteWindow.popup called with immediate={immediate}")
+        print("PaletteWindow.popup called with immediate=", immediate)
         if self._widget is None:
             return
 
         if self._invoker is not None:
             full_size_request = self.get_full_size_request()
-            if hasattr(self._invoker, "get_alignment"):
-                self._alignment = self._invoker.get_alignment(full_size_request)
+            if self._invoker_get_alignment is not None:
+                self._alignment = self._invoker_get_alignment(full_size_request)
 
             self.update_position()
 
             try:
-                if hasattr(self._widget, "set_transient_for") and hasattr(
-                    self._invoker, "get_toplevel"
+                if (
+                    self._widget_set_transient_for is not None
+                    and self._invoker_get_toplevel is not None
                 ):
-                    toplevel = self._invoker.get_toplevel()
+                    toplevel = self._invoker_get_toplevel()
                     if toplevel and isinstance(toplevel, Gtk.Window):
                         self._widget.set_transient_for(toplevel)
             except (TypeError, AttributeError):
@@ -730,16 +863,16 @@ class PaletteWindow(GObject.GObject):
             self._popup_anim.start()
         else:
             self._popup_anim.stop()
-            if hasattr(self._widget, "popup"):
-                self._widget.popup(self._invoker)
+            if self._widget_popup is not None:
+                self._widget_popup(self._invoker)
             else:
                 self._widget.present()
             self.update_position()
 
     def popdown(self, immediate=False):
         """Hide the palette."""
-        print(f"PaletteWindow.popdown called with immediate={immediate}")
-        print(f"PaletteWindow.popdown: is_up={self._up}, widget={self._widget}")
+        print("PaletteWindow.popdown called with immediate=", immediate)
+        print("PaletteWindow.popdown: is_up=", self._up, "widget=", self._widget)
         self._popup_anim.stop()
         self._mouse_detector.stop()
 
@@ -748,9 +881,9 @@ class PaletteWindow(GObject.GObject):
         else:
             self._popdown_anim.stop()
             if self._widget is not None:
-                if hasattr(self._widget, "popdown"):
+                if self._widget_popdown is not None:
                     print("PaletteWindow.popdown: calling widget.popdown()")
-                    self._widget.popdown()
+                    self._widget_popdown()
                 else:
                     print("PaletteWindow.popdown: setting widget invisible")
                     self._widget.set_visible(False)
@@ -771,17 +904,34 @@ class PaletteWindow(GObject.GObject):
 
     def _invoker_mouse_enter_cb(self, invoker):
         if not getattr(self._invoker, "locked", False):
-            self.on_invoker_enter()
+            self._queue_invoker_crossing(True)
 
     def _invoker_mouse_leave_cb(self, invoker):
         if not getattr(self._invoker, "locked", False):
+            self._queue_invoker_crossing(False)
+
+    def _queue_invoker_crossing(self, entered):
+        """Collapse enter/leave bursts into one decision per idle."""
+        self._pending_invoker_enter = entered
+        if self._invoker_idle_id is None:
+            self._invoker_idle_id = GLib.idle_add(self.__invoker_crossing_idle_cb)
+
+    def __invoker_crossing_idle_cb(self):
+        self._invoker_idle_id = None
+        entered = self._pending_invoker_enter
+        self._pending_invoker_enter = None
+
+        if entered:
+            self.on_invoker_enter()
+        elif entered is not None:
             self.on_invoker_leave()
+        return _SOURCE_REMOVE
 
     def _invoker_right_click_cb(self, invoker):
         self.popup(immediate=True)
 
     def _invoker_toggle_state_cb(self, invoker):
-        print(f"PaletteWindow._invoker_toggle_state_cb called with invoker={invoker}")
+        print("PaletteWindow._invoker_toggle_state_cb called with invoker=", invoker)
         if self.is_up():
             print(
                 "PaletteWindow._invoker_toggle_state_cb: palette is up, calling popdown"
@@ -802,60 +952,141 @@ class PaletteWindow(GObject.GObject):
             self.on_leave()
 
     def __key_press_event_cb(self, controller, keyval, keycode, state):
-        if keyval == Gdk.KEY_Escape:
+        if keyval == _KEY_ESCAPE:
             self.popdown()
             return True
 
     def __show_cb(self, widget):
-        if self._invoker is not None and hasattr(self._invoker, "notify_popup"):
-            self._invoker.notify_popup()
+        if self._invoker_notify_popup is not None:
+            self._invoker_notify_popup()
 
         self._up = True
         self.emit("popup")
 
     def __hide_cb(self, widget):
-        if self._invoker and hasattr(self._invoker, "notify_popdown"):
-            self._invoker.notify_popdown()
+        if self._invoker and self._invoker_notify_popdown is not None:
+            self._invoker_notify_popdown()
 
         self._up = False
         self.emit("popdown")
 
     def get_rect(self):
         if not self._widget:
-            return Gdk.Rectangle()
+            return _GdkRectangle()
 
-        if hasattr(self._widget, "get_rect"):
-            return self._widget.get_rect()
+        if self._widget_get_rect is not None:
+            return self._widget_get_rect()
 
         # Fallback implementation
-        rect = Gdk.Rectangle()
+        rect = _GdkRectangle()
         rect.width = self._widget.get_width()
         rect.height = self._widget.get_height()
         rect.x = rect.y = 0  # GTK4: Position managed by compositor
         return rect
 
 
-class _PopupAnimation(animator.Animation):
+@functools.lru_cache(maxsize=256)
+def _compute_aligned_xy(
+    palette_halign,
+    palette_valign,
+    invoker_halign,
+    invoker_valign,
+    palette_width,
+    palette_height,
+    rect_x,
+    rect_y,
+    rect_width,
+    rect_height,
+):
+    """Place a palette of the given size against a rect for an alignment."""
+    x = rect_x + rect_width * invoker_halign + palette_width * palette_halign
+    y = rect_y + rect_height * invoker_valign + palette_height * palette_valign
+    return int(x), int(y)
+
+
+def _normalize_dim(palette_dim):
+    """Return a size request or (width, height) sequence as a tuple."""
+    if hasattr(palette_dim, "width"):
+        return (int(palette_dim.width), int(palette_dim.height))
+    return (int(palette_dim[0]), int(palette_dim[1]))
+
+
+_screen_area = None
+_watched_monitors = None
+
+
+def _monitors_changed_cb(monitors, position, removed, added):
+    global _screen_area
+    _screen_area = None
+
+
+def _get_screen_area():
+    """Get the geometry of the first monitor, shared by all invokers."""
+    global _screen_area, _watched_monitors
+    if _screen_area is not None:
+        return _screen_area
+
+    display = Gdk.Display.get_default()
+    if display:
+        monitors = display.get_monitors()
+        # Monitor hotplug invalidates the shared geometry
+        if monitors is not _watched_monitors:
+            monitors.connect("items-changed", _monitors_changed_cb)
+            _watched_monitors = monitors
+
+        monitor = monitors.get_item(0)
+        if monitor is not None:
+            _screen_area = monitor.get_geometry()
+            return _screen_area
+
+    rect = Gdk.Rectangle()
+    rect.x = rect.y = 0
+    rect.width = 1024
+    rect.height = 768
+    return rect
+
+
+class _PopupAnimation:
+    """Pop the palette up once the popup delay has elapsed.
+
+    The animation has no intermediate frames, so a single one-shot
+    timeout stands in for a full animator.
+    """
+
+    __slots__ = ("_palette", "_timeout_hid")
+
+    _DELAY_MS = 500
+
     def __init__(self, palette):
-        super().__init__(0.0, 1.0)
         self._palette = palette
+        self._timeout_hid = None
 
-    def next_frame(self, frame):
-        # overriding classes hence the name change
-        """Handle animation frame."""
-        if frame == 1.0:
-            self._palette.popup(immediate=True)
+    def start(self):
+        self.stop()
+        self._timeout_hid = _glib_timeout_add(self._DELAY_MS, self._timeout_cb)
 
+    def stop(self):
+        if self._timeout_hid is not None:
+            _glib_source_remove(self._timeout_hid)
+            self._timeout_hid = None
 
-class _PopdownAnimation(animator.Animation):
+    def _timeout_cb(self):
+        self._timeout_hid = None
+        self._complete()
+        return _SOURCE_REMOVE
 
-    def __init__(self, palette):
-        super().__init__(0.0, 1.0)
-        self._palette = palette
+    def _complete(self):
+        self._palette.popup(immediate=True)
+
+
+class _PopdownAnimation(_PopupAnimation):
 
-    def next_frame(self, frame):
-        if frame == 1.0:
-            self._palette.popdown(immediate=True)
+    __slots__ = ()
+
+    _DELAY_MS = 600
+
+    def _complete(self):
+        self._palette.popdown(immediate=True)
 
 
 class Invoker(GObject.GObject):
@@ -879,27 +1110,34 @@ class Invoker(GObject.GObject):
     TOP = [(0.0, -1.0, 0.0, 0.0), (-1.0, -1.0, 1.0, 0.0)]
     LEFT = [(-1.0, 0.0, 0.0, 0.0), (-1.0, -1.0, 0.0, 1.0)]
 
+    # Side lookups for get_alignment
+    _VERTICAL_SIDE_SET = frozenset(LEFT + RIGHT)
+    _HORIZONTAL_SIDE_SET = frozenset(TOP + BOTTOM)
+
+    # Candidate alignments in search order, built once
+    _DEFAULT_ALIGNMENTS = tuple(BOTTOM + RIGHT + TOP + LEFT)
+    _AT_CURSOR_ALIGNMENTS = (
+        (0.0, 0.0, 1.0, 1.0),
+        (0.0, -1.0, 1.0, 0.0),
+        (-1.0, -1.0, 0.0, 0.0),
+        (-1.0, 0.0, 0.0, 1.0),
+    )
+
     def __init__(self):
         super().__init__()
 
         self.parent = None
+        self._create_palette_fn = None
 
-        # Get screen dimensions for GTK4
-        display = Gdk.Display.get_default()
-        if display:
-            monitor = display.get_monitors().get_item(0)
-            geometry = monitor.get_geometry()  # type: ignore
-            self._screen_area = geometry
-        else:
-            self._screen_area = Gdk.Rectangle()
-            self._screen_area.x = self._screen_area.y = 0
-            self._screen_area.width = 1024
-            self._screen_area.height = 768
+        self._set_screen_area(_get_screen_area())
 
         self._position_hint = self.ANCHORED
         self._cursor_x = -1
         self._cursor_y = -1
+        self._last_alignment_key = None
+        self._last_alignment = None
         self._palette = None
+        self._in_palette_callback = False
         self._cache_palette = True
         self._toggle_palette = False
         self._lock_palette = False
@@ -907,95 +1145,118 @@ class Invoker(GObject.GObject):
 
     def attach(self, parent):
         self.parent = parent
+        self._create_palette_fn = getattr(parent, "create_palette", None)
 
     def detach(self):
         self.parent = None
+        self._create_palette_fn = None
         if self._palette is not None:
             self._palette.destroy()
             self._palette = None
 
-    def _get_position_for_alignment(self, alignment, palette_dim):
-        palette_halign = alignment[0]
-        palette_valign = alignment[1]
-        invoker_halign = alignment[2]
-        invoker_valign = alignment[3]
+    def _set_screen_area(self, screen_area):
+        """Set the screen area and cache its edges for the fit tests."""
+        self._screen_area = screen_area
+        self._screen_x1 = screen_area.x
+        self._screen_y1 = screen_area.y
+        self._screen_x2 = screen_area.x + screen_area.width
+        self._screen_y2 = screen_area.y + screen_area.height
 
+    def _resolve_cursor(self):
+        """Fill in the cursor position from the pointer if it is unset."""
         if self._cursor_x == -1 or self._cursor_y == -1:
             if self.parent:
-                try:
-                    position = _get_pointer_position(self.parent)
-                    (self._cursor_x, self._cursor_y) = position
-                except Exception:
-                    self._cursor_x = self._cursor_y = 0
+                self._cursor_x, self._cursor_y = _get_pointer_position(self.parent)
+
+    def _compute_position_tuple(self, alignment, palette_dim):
+        """Compute the palette (x, y, width, height) for an alignment.
+
+        palette_dim must already be a (width, height) tuple, see
+        _normalize_dim().
+        """
+        self._resolve_cursor()
 
         if self._position_hint is self.ANCHORED:
             rect = self.get_rect()
+            rect_x = rect.x
+            rect_y = rect.y
+            rect_width = rect.width
+            rect_height = rect.height
         else:
             dist = style.PALETTE_CURSOR_DISTANCE
-            rect = Gdk.Rectangle()
-            rect.x = self._cursor_x - dist
-            rect.y = self._cursor_y - dist
-            rect.width = rect.height = dist * 2
-
-        if hasattr(palette_dim, "width"):
-            palette_width = palette_dim.width
-            palette_height = palette_dim.height
-        else:
-            # Handle tuple/list case
-            palette_width, palette_height = palette_dim[0], palette_dim[1]
-
-        x = rect.x + rect.width * invoker_halign + palette_width * palette_halign
-
-        y = rect.y + rect.height * invoker_valign + palette_height * palette_valign
+            rect_x = self._cursor_x - dist
+            rect_y = self._cursor_y - dist
+            rect_width = rect_height = dist * 2
+
+        palette_width, palette_height = palette_dim
+        x, y = _compute_aligned_xy(
+            *alignment,
+            palette_width,
+            palette_height,
+            rect_x,
+            rect_y,
+            rect_width,
+            rect_height,
+        )
+        return (x, y, palette_width, palette_height)
 
-        rect = Gdk.Rectangle()
-        rect.x = int(x)
-        rect.y = int(y)
-        rect.width = palette_width
-        rect.height = palette_height
+    @staticmethod
+    def _tuple_to_rect(position):
+        rect = _GdkRectangle()
+        rect.x, rect.y, rect.width, rect.height = position
         return rect
 
     def _in_screen(self, rect):
-        """Check if rectangle is within screen bounds."""
+        """Check if an (x, y, width, height) tuple is within screen bounds."""
+        rx, ry, rw, rh = rect
         return (
-            rect.x >= self._screen_area.x
-            and rect.y >= self._screen_area.y
-            and rect.x + rect.width <= self._screen_area.x + self._screen_area.width
-            and rect.y + rect.height <= self._screen_area.y + self._screen_area.height
+            rx >= self._screen_x1
+            and ry >= self._screen_y1
+            and rx + rw <= self._screen_x2
+            and ry + rh <= self._screen_y2
         )
 
     def _get_area_in_screen(self, rect):
-        """Return area of rectangle visible in the screen."""
-        x1 = max(rect.x, self._screen_area.x)
-        y1 = max(rect.y, self._screen_area.y)
-        x2 = min(rect.x + rect.width, self._screen_area.x + self._screen_area.width)
-        y2 = min(rect.y + rect.height, self._screen_area.y + self._screen_area.height)
-
-        return max(0, (x2 - x1) * (y2 - y1))
+        """Return area of an (x, y, width, height) tuple visible on screen."""
+        sx1 = self._screen_x1
+        sy1 = self._screen_y1
+        sx2 = self._screen_x2
+        sy2 = self._screen_y2
+        rx1, ry1, rw, rh = rect
+        rx2 = rx1 + rw
+        ry2 = ry1 + rh
+
+        if rx1 >= sx2 or ry1 >= sy2 or rx2 <= sx1 or ry2 <= sy1:
+            return 0
+
+        x1 = rx1 if rx1 > sx1 else sx1
+        y1 = ry1 if ry1 > sy1 else sy1
+        x2 = rx2 if rx2 < sx2 else sx2
+        y2 = ry2 if ry2 < sy2 else sy2
+        return (x2 - x1) * (y2 - y1)
 
     def _get_alignments(self):
         """Get possible alignments for this invoker."""
         if self._position_hint is self.AT_CURSOR:
-            return [
-                (0.0, 0.0, 1.0, 1.0),
-                (0.0, -1.0, 1.0, 0.0),
-                (-1.0, -1.0, 0.0, 0.0),
-                (-1.0, 0.0, 0.0, 1.0),
-            ]
+            return self._AT_CURSOR_ALIGNMENTS
         else:
-            return self.BOTTOM + self.RIGHT + self.TOP + self.LEFT
+            return self._DEFAULT_ALIGNMENTS
 
     def get_position_for_alignment(self, alignment, palette_dim):
         """Get position for specific alignment if it fits on screen."""
-        rect = self._get_position_for_alignment(alignment, palette_dim)
-        if self._in_screen(rect):
-            return rect
+        palette_dim = _normalize_dim(palette_dim)
+        position = self._compute_position_tuple(alignment, palette_dim)
+        if self._in_screen(position):
+            return self._tuple_to_rect(position)
         else:
             return None
 
     def get_position(self, palette_dim):
-        alignment = self.get_alignment(palette_dim)
-        rect = self._get_position_for_alignment(alignment, palette_dim)
+        palette_dim = _normalize_dim(palette_dim)
+        alignment, position = self._compute_best_alignment_and_rect(palette_dim)
+        if position is None:
+            position = self._compute_position_tuple(alignment, palette_dim)
+        rect = self._tuple_to_rect(position)
 
         # In case our efforts to find an optimum place inside the screen
         # failed, just make sure the palette fits inside the screen if at all
@@ -1009,13 +1270,55 @@ class Invoker(GObject.GObject):
         return rect
 
     def get_alignment(self, palette_dim):
+        alignment, position = self._compute_best_alignment_and_rect(
+            _normalize_dim(palette_dim)
+        )
+        return alignment
+
+    def _compute_best_alignment_and_rect(self, palette_dim):
+        """Find the best alignment for a (width, height) palette size.
+
+        Returns the alignment and its (x, y, width, height) position when
+        that was already computed during the search, None otherwise.
+        """
+        palette_width, palette_height = palette_dim
+
+        rect = self.get_rect()
+        alignments = self._get_alignments()
+        self._resolve_cursor()
+
+        # Repeated popups of the same palette usually fit the same way. The
+        # key holds every input of the search below, so on a match the
+        # alignment that fitted first last time is the one it would pick
+        key = (
+            palette_width,
+            palette_height,
+            self._cursor_x,
+            self._cursor_y,
+            rect.x,
+            rect.y,
+            rect.width,
+            rect.height,
+            self._position_hint,
+            self._screen_x1,
+            self._screen_y1,
+            self._screen_x2,
+            self._screen_y2,
+            alignments,
+        )
+        if key == self._last_alignment_key:
+            alignment = self._last_alignment
+            return alignment, self._compute_position_tuple(alignment, palette_dim)
+
         best_alignment = None
         best_area = -1
 
-        for alignment in self._get_alignments():
-            pos = self._get_position_for_alignment(alignment, palette_dim)
+        for alignment in alignments:
+            pos = self._compute_position_tuple(alignment, palette_dim)
             if self._in_screen(pos):
-                return alignment
+                self._last_alignment_key = key
+                self._last_alignment = alignment
+                return alignment, pos
 
             area = self._get_area_in_screen(pos)
             if area > best_area:
@@ -1023,28 +1326,16 @@ class Invoker(GObject.GObject):
                 best_area = area
 
         if not best_alignment:
-            return self._get_alignments()[0]
-
-        # Palette horiz/vert alignment
-        ph = best_alignment[0]
-        pv = best_alignment[1]
+            return alignments[0], None
 
-        # Invoker horiz/vert alignment
-        ih = best_alignment[2]
-        iv = best_alignment[3]
+        # Palette and invoker horiz/vert alignment
+        ph, pv, ih, iv = best_alignment
 
-        rect = self.get_rect()
-        screen_area = self._screen_area
-
-        if hasattr(palette_dim, "width"):
-            palette_width = palette_dim.width
-            palette_height = palette_dim.height
-        else:
-            palette_width, palette_height = palette_dim[0], palette_dim[1]
+        rect_x, rect_y, rect_width, rect_height = key[4:8]
 
-        if best_alignment in self.LEFT or best_alignment in self.RIGHT:
-            dtop = rect.y - screen_area.y
-            dbottom = screen_area.y + screen_area.height - rect.y - rect.height
+        if best_alignment in self._VERTICAL_SIDE_SET:
+            dtop = rect_y - self._screen_y1
+            dbottom = self._screen_y2 - rect_y - rect_height
 
             iv = 0
 
@@ -1052,11 +1343,11 @@ class Invoker(GObject.GObject):
             if dtop > dbottom:
                 pv = -float(dtop) / palette_height
             else:
-                pv = -float(palette_height - dbottom - rect.height) / palette_height
+                pv = -float(palette_height - dbottom - rect_height) / palette_height
 
-        elif best_alignment in self.TOP or best_alignment in self.BOTTOM:
-            dleft = rect.x - screen_area.x
-            dright = screen_area.x + screen_area.width - rect.x - rect.width
+        elif best_alignment in self._HORIZONTAL_SIDE_SET:
+            dleft = rect_x - self._screen_x1
+            dright = self._screen_x2 - rect_x - rect_width
 
             ih = 0
 
@@ -1065,9 +1356,9 @@ class Invoker(GObject.GObject):
                 if dleft > dright:
                     ph = -float(dleft) / palette_width
                 else:
-                    ph = -float(palette_width - dright - rect.width) / palette_width
+                    ph = -float(palette_width - dright - rect_width) / palette_width
 
-        return (ph, pv, ih, iv)
+        return (ph, pv, ih, iv), None
 
     def has_rectangle_gap(self):
         return False
@@ -1083,11 +1374,10 @@ class Invoker(GObject.GObject):
         self._cursor_y = -1
 
     def _ensure_palette_exists(self):
-        if self.parent and self.palette is None:
-            if hasattr(self.parent, "create_palette"):
-                palette = self.parent.create_palette()
-                if palette is not None:
-                    self.palette = palette
+        if self._create_palette_fn is not None and self.palette is None:
+            palette = self._create_palette_fn()
+            if palette is not None:
+                self.palette = palette
 
     def notify_mouse_enter(self):
         self._ensure_palette_exists()
@@ -1113,9 +1403,9 @@ class Invoker(GObject.GObject):
         self.emit("right-click")
 
     def notify_toggle_state(self):
-        print("ToolInvoker.notify_toggle_state called")
+        logger.debug("Invoker.notify_toggle_state called")
         self._ensure_palette_exists()
-        print("ToolInvoker emitting 'toggle-state' signal")
+        logger.debug("Invoker emitting 'toggle-state' signal")
         self.emit("toggle-state")
 
     def _process_event(self, x, y):
@@ -1127,13 +1417,17 @@ class Invoker(GObject.GObject):
         return self._palette
 
     def set_palette(self, palette):
-        if self._palette is not None:
-            self._palette.popdown(immediate=True)
-            self._palette.props.invoker = None
-            GLib.idle_add(
-                lambda old_palette=self._palette: old_palette.destroy(),
-                priority=GLib.PRIORITY_LOW,
-            )  # type: ignore
+        old_palette = self._palette
+        if old_palette is not None:
+            # Cleared first so a popdown handler re-entering here is a no-op
+            self._palette = None
+            old_palette.popdown(immediate=True)
+            old_palette.props.invoker = None
+            if self._in_palette_callback:
+                # The old palette is still emitting, destroy it later
+                GLib.idle_add(old_palette.destroy, priority=GLib.PRIORITY_LOW)
+            else:
+                old_palette.destroy()
 
         self._palette = palette
 
@@ -1174,8 +1468,12 @@ class Invoker(GObject.GObject):
     )
 
     def __palette_popdown_cb(self, palette):
-        if not self.props.cache_palette:
-            self.set_palette(None)
+        if not self._cache_palette:
+            self._in_palette_callback = True
+            try:
+                self.set_palette(None)
+            finally:
+                self._in_palette_callback = False
 
     def primary_text_clicked(self):
         pass
@@ -1200,9 +1498,7 @@ class WidgetInvoker(Invoker):
         self._widget = None
         self._expanded = False
         self._pointer_position = (-1, -1)
-        self._motion_controller = None
-        self._click_controller = None
-        self._long_press_gesture = None
+        self._controllers = []
         self._long_pressed_recognized = False
 
         if parent or widget:
@@ -1215,10 +1511,7 @@ class WidgetInvoker(Invoker):
             self._widget = parent
 
         if self._widget:
-            try:
-                self._pointer_position = _get_pointer_position(self._widget)
-            except Exception:
-                self._pointer_position = (0, 0)
+            self._pointer_position = _get_pointer_position(self._widget)
 
         self.notify("widget")
 
@@ -1234,31 +1527,38 @@ class WidgetInvoker(Invoker):
         # Ensure widget is focusable and sensitive for event handling
         self._widget.set_can_focus(True)
         self._widget.set_sensitive(True)
-        print(
-            f"WidgetInvoker._setup_controllers: set_can_focus and set_sensitive for {self._widget}"
+        logger.debug(
+            "WidgetInvoker._setup_controllers: set_can_focus and set_sensitive "
+            "for %s",
+            self._widget,
         )
 
         # Motion controller for enter/leave events
-        self._motion_controller = Gtk.EventControllerMotion()
-        self._motion_controller.connect("enter", self.__enter_notify_event_cb)
-        self._motion_controller.connect("leave", self.__leave_notify_event_cb)
-        self._widget.add_controller(self._motion_controller)
+        motion_controller = Gtk.EventControllerMotion()
+        motion_controller.connect("enter", self.__enter_notify_event_cb)
+        motion_controller.connect("leave", self.__leave_notify_event_cb)
+        self._widget.add_controller(motion_controller)
+        self._controllers.append(motion_controller)
 
         # Click controller for button events
-        self._click_controller = Gtk.GestureClick()
-        self._click_controller.connect("released", self.__button_release_event_cb)
-        self._widget.add_controller(self._click_controller)
+        click_controller = Gtk.GestureClick()
+        click_controller.connect("released", self.__button_release_event_cb)
+        self._widget.add_controller(click_controller)
+        self._controllers.append(click_controller)
 
         # Long press gesture
-        self._long_press_gesture = Gtk.GestureLongPress()
-        self._long_press_gesture.connect("pressed", self.__long_pressed_event_cb)
-        self._widget.add_controller(self._long_press_gesture)
+        long_press_gesture = Gtk.GestureLongPress()
+        long_press_gesture.connect("pressed", self.__long_pressed_event_cb)
+        self._widget.add_controller(long_press_gesture)
+        self._controllers.append(long_press_gesture)
 
         # Connect to clicked signal if available
         try:
             if GObject.signal_lookup("clicked", self._widget):
-                print(
-                    f"WidgetInvoker._setup_controllers: connecting to 'clicked' signal for {self._widget}"
+                logger.debug(
+                    "WidgetInvoker._setup_controllers: connecting to 'clicked' "
+                    "signal for %s",
+                    self._widget,
                 )
                 self._widget.connect("clicked", self.__click_event_cb)
         except (TypeError, AttributeError):
@@ -1266,15 +1566,9 @@ class WidgetInvoker(Invoker):
 
     def detach(self):
         if self._widget:
-            try:
-                if self._motion_controller:
-                    self._widget.remove_controller(self._motion_controller)
-                if self._click_controller:
-                    self._widget.remove_controller(self._click_controller)
-                if self._long_press_gesture:
-                    self._widget.remove_controller(self._long_press_gesture)
-            except Exception:
-                pass
+            for controller in self._controllers:
+                self._widget.remove_controller(controller)
+        self._controllers.clear()
 
         super().detach()
 
@@ -1287,15 +1581,13 @@ class WidgetInvoker(Invoker):
 
         # Get widget position - GTK4
         x = y = 0
-        try:
-            native = self._widget.get_native()
-            if native:
-                success, transform = self._widget.compute_transform(native)
-                if success and transform:
-                    x = transform.get_value(0, 3)
-                    y = transform.get_value(1, 3)
-        except Exception:
-            x = y = 0
+        native = self._widget.get_native()
+        if native is not None:
+            success, transform = self._widget.compute_transform(native)
+            if success:
+                origin = transform.transform_point(_ORIGIN)
+                x = origin.x
+                y = origin.y
 
         rect = Gdk.Rectangle()
         rect.x = int(x)
@@ -1334,23 +1626,29 @@ class WidgetInvoker(Invoker):
     def __button_release_event_cb(self, gesture, n_press, x, y):
         button = gesture.get_current_button()
 
-        print(
-            f"ToolInvoker.__button_release_event_cb called: button={button}, n_press={n_press}, x={x}, y={y}"
+        logger.debug(
+            "WidgetInvoker.__button_release_event_cb called: button=%s, "
+            "n_press=%s, x=%s, y=%s",
+            button,
+            n_press,
+            x,
+            y,
         )
         if button == 3:  # Right click
-            print("ToolInvoker: right click detected")
+            logger.debug("WidgetInvoker: right click detected")
             self.notify_right_click(x, y)
             return True
         elif button == 1:  # Left click
-            print("ToolInvoker: left click detected")
+            logger.debug("WidgetInvoker: left click detected")
             if self._lock_palette and not self.locked:
                 self.locked = True
                 if hasattr(self.parent, "set_expanded"):
                     self.parent.set_expanded(True)  # type: ignore
 
             if self._toggle_palette:
-                print(
-                    "ToolInvoker: toggle_palette is True, calling notify_toggle_state"
+                logger.debug(
+                    "WidgetInvoker: toggle_palette is True, calling "
+                    "notify_toggle_state"
                 )
                 self.notify_toggle_state()
                 return True
@@ -1361,7 +1659,10 @@ class WidgetInvoker(Invoker):
         self.notify_right_click(x, y)
 
     def __click_event_cb(self, widget):
-        print(f"WidgetInvoker.__click_event_cb: 'clicked' signal received for {widget}")
+        logger.debug(
+            "WidgetInvoker.__click_event_cb: 'clicked' signal received for %s",
+            widget,
+        )
         if not self._long_pressed_recognized:
             if self._lock_palette and not self.locked:
                 self.locked = True
@@ -1369,8 +1670,9 @@ class WidgetInvoker(Invoker):
                     self.parent.set_expanded(True)  # type: ignore
 
             if self._toggle_palette:
-                print(
-                    "WidgetInvoker.__click_event_cb: toggle_palette is True, calling notify_toggle_state"
+                logger.debug(
+                    "WidgetInvoker.__click_event_cb: toggle_palette is True, "
+                    "calling notify_toggle_state"
                 )
                 self.notify_toggle_state()
         self._long_pressed_recognized = False
@@ -1411,9 +1713,7 @@ class CursorInvoker(Invoker):
         super().__init__()
         self._position_hint = self.AT_CURSOR
         self._pointer_position = (-1, -1)
-        self._motion_controller = None
-        self._click_controller = None
-        self._long_press_gesture = None
+        self._controllers = []
         self._long_pressed_recognized = False
 
         if parent:
@@ -1423,46 +1723,37 @@ class CursorInvoker(Invoker):
         super().attach(parent)
 
         if self.parent:
-            try:
-                self._pointer_position = _get_pointer_position(self.parent)
-            except Exception:
-                self._pointer_position = (0, 0)
+            self._pointer_position = _get_pointer_position(self.parent)
 
             # Set up event controllers
-            self._motion_controller = Gtk.EventControllerMotion()
-            self._motion_controller.connect("enter", self.__enter_notify_event_cb)
-            self._motion_controller.connect("leave", self.__leave_notify_event_cb)
-            self.parent.add_controller(self._motion_controller)
-
-            self._click_controller = Gtk.GestureClick()
-            self._click_controller.connect("released", self.__button_release_event_cb)
-            self.parent.add_controller(self._click_controller)
-
-            self._long_press_gesture = Gtk.GestureLongPress()
-            self._long_press_gesture.connect("pressed", self.__long_pressed_event_cb)
-            self.parent.add_controller(self._long_press_gesture)
+            motion_controller = Gtk.EventControllerMotion()
+            motion_controller.connect("enter", self.__enter_notify_event_cb)
+            motion_controller.connect("leave", self.__leave_notify_event_cb)
+            self.parent.add_controller(motion_controller)
+            self._controllers.append(motion_controller)
+
+            click_controller = Gtk.GestureClick()
+            click_controller.connect("released", self.__button_release_event_cb)
+            self.parent.add_controller(click_controller)
+            self._controllers.append(click_controller)
+
+            long_press_gesture = Gtk.GestureLongPress()
+            long_press_gesture.connect("pressed", self.__long_pressed_event_cb)
+            self.parent.add_controller(long_press_gesture)
+            self._controllers.append(long_press_gesture)
 
     def detach(self):
         """Detach from the parent."""
         if self.parent:
-            try:
-                if self._motion_controller:
-                    self.parent.remove_controller(self._motion_controller)
-                if self._click_controller:
-                    self.parent.remove_controller(self._click_controller)
-                if self._long_press_gesture:
-                    self.parent.remove_controller(self._long_press_gesture)
-            except Exception:
-                pass
+            for controller in self._controllers:
+                self.parent.remove_controller(controller)
+        self._controllers.clear()
 
         super().detach()
 
     def get_rect(self):
         if self.parent:
-            try:
-                x, y = _get_pointer_position(self.parent)
-            except Exception:
-                x = y = 0
+            x, y = _get_pointer_position(self.parent)
         else:
             x = y = 0
 
@@ -1521,6 +1812,10 @@ class ToolInvoker(WidgetInvoker):
         parent (gtk.widget):  toolitem to connect invoker to
     """
 
+    # Perpendicular alignments for horizontal and vertical toolbars
+    _H_ALIGNMENTS = tuple(Invoker.BOTTOM + Invoker.TOP)
+    _V_ALIGNMENTS = tuple(Invoker.LEFT + Invoker.RIGHT)
+
     def __init__(self, parent=None):
         super().__init__()
         self._tool = None
@@ -1547,9 +1842,9 @@ class ToolInvoker(WidgetInvoker):
         parent = self._widget.get_parent()
         if hasattr(parent, "get_orientation"):
             if parent.get_orientation() == Gtk.Orientation.HORIZONTAL:
-                return self.BOTTOM + self.TOP
+                return self._H_ALIGNMENTS
             else:
-                return self.LEFT + self.RIGHT
+                return self._V_ALIGNMENTS
 
         return super()._get_alignments()
 
@@ -1575,44 +1870,41 @@ class TreeViewInvoker(Invoker):
         super().__init__()
 
         self._tree_view = None
-        self._motion_controller = None
-        self._click_controller = None
-        self._long_press_gesture = None
+        self._controllers = []
         self._position_hint = self.AT_CURSOR
 
         self._path = None
         self._column = None
+        self._hit_area = None
         self.palette = None
 
     def attach_treeview(self, tree_view):
         self._tree_view = tree_view
 
         # Set up event controllers
-        self._motion_controller = Gtk.EventControllerMotion()
-        self._motion_controller.connect("motion", self.__motion_notify_event_cb)
-        tree_view.add_controller(self._motion_controller)
+        motion_controller = Gtk.EventControllerMotion()
+        motion_controller.connect("motion", self.__motion_notify_event_cb)
+        tree_view.add_controller(motion_controller)
+        self._controllers.append(motion_controller)
 
-        self._click_controller = Gtk.GestureClick()
-        self._click_controller.connect("released", self.__button_release_event_cb)
-        tree_view.add_controller(self._click_controller)
+        click_controller = Gtk.GestureClick()
+        click_controller.connect("released", self.__button_release_event_cb)
+        tree_view.add_controller(click_controller)
+        self._controllers.append(click_controller)
 
-        self._long_press_gesture = Gtk.GestureLongPress()
-        self._long_press_gesture.connect("pressed", self.__long_pressed_event_cb)
-        tree_view.add_controller(self._long_press_gesture)
+        long_press_gesture = Gtk.GestureLongPress()
+        long_press_gesture.connect("pressed", self.__long_pressed_event_cb)
+        tree_view.add_controller(long_press_gesture)
+        self._controllers.append(long_press_gesture)
 
         self.attach(tree_view)
 
     def detach(self):
         if self._tree_view:
-            try:
-                if self._motion_controller:
-                    self._tree_view.remove_controller(self._motion_controller)
-                if self._click_controller:
-                    self._tree_view.remove_controller(self._click_controller)
-                if self._long_press_gesture:
-                    self._tree_view.remove_controller(self._long_press_gesture)
-            except Exception:
-                pass
+            for controller in self._controllers:
+                self._tree_view.remove_controller(controller)
+        self._controllers.clear()
+        self._hit_area = None
 
         super().detach()
 
@@ -1623,39 +1915,32 @@ class TreeViewInvoker(Invoker):
             rect.width = rect.height = 50
             return rect
 
-        try:
-            # Get cell area
-            cell_area = self._tree_view.get_cell_area(self._path, self._column)
+        # Get cell area
+        cell_area = self._tree_view.get_cell_area(self._path, self._column)
 
-            # Convert to widget coordinates
-            widget_x, widget_y = self._tree_view.convert_tree_to_widget_coords(
-                cell_area.x, cell_area.y
-            )
+        # Convert to widget coordinates
+        widget_x, widget_y = self._tree_view.convert_tree_to_widget_coords(
+            cell_area.x, cell_area.y
+        )
 
-            # Get widget position in root coordinates
-            root_x = root_y = 0
-            try:
-                native = self._tree_view.get_native()
-                if native:
-                    success, transform = self._tree_view.compute_transform(native)
-                    if success and transform:
-                        root_x = transform.get_value(0, 3) + widget_x
-                        root_y = transform.get_value(1, 3) + widget_y
-            except Exception:
-                root_x = widget_x
-                root_y = widget_y
+        # Get widget position in root coordinates
+        root_x = root_y = 0
+        native = self._tree_view.get_native()
+        if native is not None:
+            success, transform = self._tree_view.compute_transform(native)
+            if success:
+                point = transform.transform_point(
+                    Graphene.Point().init(widget_x, widget_y)
+                )
+                root_x = point.x
+                root_y = point.y
 
-            rect = Gdk.Rectangle()
-            rect.x = int(root_x)
-            rect.y = int(root_y)
-            rect.width = cell_area.width
-            rect.height = cell_area.height
-            return rect
-        except Exception:
-            rect = Gdk.Rectangle()
-            rect.x = rect.y = 0
-            rect.width = rect.height = 50
-            return rect
+        rect = Gdk.Rectangle()
+        rect.x = int(root_x)
+        rect.y = int(root_y)
+        rect.width = cell_area.width
+        rect.height = cell_area.height
+        return rect
 
     def get_toplevel(self):
         if self._tree_view:
@@ -1666,7 +1951,21 @@ class TreeViewInvoker(Invoker):
         if not self._tree_view:
             return
 
-        here = self._tree_view.get_path_at_pos(int(x), int(y))
+        ix = int(x)
+        iy = int(y)
+
+        # Most motion stays inside the hovered cell, skip the hit test
+        # while the pointer is in it and the view has not scrolled
+        hit_area = self._hit_area
+        if hit_area is not None:
+            x1, y1, x2, y2, visible_x, visible_y = hit_area
+            if x1 <= ix < x2 and y1 <= iy < y2:
+                visible = self._tree_view.get_visible_rect()
+                if visible.x == visible_x and visible.y == visible_y:
+                    return
+            self._hit_area = None
+
+        here = self._tree_view.get_path_at_pos(ix, iy)
         if here is None:
             if self._path is not None:
                 self.notify_mouse_leave()
@@ -1675,6 +1974,17 @@ class TreeViewInvoker(Invoker):
             return
 
         path, column, x_, y_ = here
+        area = self._tree_view.get_background_area(path, column)
+        visible = self._tree_view.get_visible_rect()
+        self._hit_area = (
+            area.x,
+            area.y,
+            area.x + area.width,
+            area.y + area.height,
+            visible.x,
+            visible.y,
+        )
+
         if path != self._path or column != self._column:
             self._redraw_cell(self._path, self._column)
             self._redraw_cell(path, column)
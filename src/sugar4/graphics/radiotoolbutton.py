@@ -46,6 +46,16 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+class _RadioGroup:
+    """Members of a radio group and the one that is currently active."""
+
+    __slots__ = ("members", "active")
+
+    def __init__(self, member):
+        self.members = [member]
+        self.active = None
+
+
 class RadioToolButton(ToolButton):
     """
     A toolbar button that acts as a radio button.
@@ -69,16 +79,12 @@ class RadioToolButton(ToolButton):
         """
         super().__init__(**kwargs)
 
-        self._group = []
         self._active = False
+        self._radio_group = _RadioGroup(self)
 
         # Set up radio group
         if group is not None:
             self.set_group(group)
-        else:
-            self._group = [self]
-
-        self.connect("clicked", self._on_clicked)
 
         # radio button styling
         self.add_css_class("radio-tool-button")
@@ -103,14 +109,14 @@ class RadioToolButton(ToolButton):
         """
         style.apply_css_to_widget(self, css)
 
-    def _on_clicked(self, button):
-        """Handle button click."""
+    def do_clicked(self):
+        """Class handler for clicked, runs before connected handlers."""
         if not self._active:
             self.set_active(True)
 
     def get_group(self):
         """Get the list of buttons in this radio group."""
-        return self._group[:]
+        return self._radio_group.members[:]
 
     def set_group(self, group_member):
         """
@@ -120,15 +126,23 @@ class RadioToolButton(ToolButton):
             group_member: Another RadioToolButton to join groups with
         """
         if group_member and isinstance(group_member, RadioToolButton):
-            if self in self._group:
-                self._group.remove(self)
-
-            self._group = group_member._group
-            if self not in self._group:
-                self._group.append(self)
-
-            for member in self._group:
-                member._group = self._group
+            old_group = self._radio_group
+            group = group_member._radio_group
+            if group is old_group:
+                return
+
+            old_group.members.remove(self)
+            if old_group.active is self:
+                old_group.active = None
+
+            group.members.append(self)
+            self._radio_group = group
+            if self._active:
+                # Keep a single active member in the joined group
+                if group.active is None:
+                    group.active = self
+                else:
+                    self._set_active_internal(False)
 
     def get_active(self):
         """Get whether this button is active."""
@@ -145,16 +159,23 @@ class RadioToolButton(ToolButton):
             return
 
         if active:
-            # Deactivate all other buttons in group
-            for member in self._group:
-                if member != self and member._active:
-                    member._set_active_internal(False)
-
-            self._set_active_internal(True)
+            # Deactivate the previously active button in group
+            previous = self._radio_group.active
+            if previous is not None and previous is not self:
+                previous.freeze_notify()
+                self.freeze_notify()
+                try:
+                    previous._set_active_internal(False)
+                    self._set_active_internal(True)
+                finally:
+                    self.thaw_notify()
+                    previous.thaw_notify()
+            else:
+                self._set_active_internal(True)
         else:
             # Only allow deactivation if another button is being activated
             # or if this is the only button in the group
-            if len(self._group) == 1:
+            if len(self._radio_group.members) == 1:
                 self._set_active_internal(False)
 
     def _set_active_internal(self, active):
@@ -163,18 +184,27 @@ class RadioToolButton(ToolButton):
             return
 
         self._active = active
-
         if active:
-            self.add_css_class("active")
-        else:
-            self.remove_css_class("active")
-
-        self.emit("toggled")
+            self._radio_group.active = self
+        elif self._radio_group.active is self:
+            self._radio_group.active = None
 
         self.set_state_flags(
             Gtk.StateFlags.CHECKED if active else Gtk.StateFlags.NORMAL, True
         )
 
+        # Write the class list once so the restyle sees the final state
+        classes = [name for name in self.get_css_classes() if name != "active"]
+        if active:
+            classes.append("active")
+        self.set_css_classes(classes)
+
+        # Skip the emission when nothing would run for it
+        if hasattr(self, "do_toggled") or GObject.signal_has_handler_pending(
+            self, _TOGGLED_SIGNAL_ID, 0, False
+        ):
+            self.emit("toggled")
+
     active = GObject.Property(
         type=bool,
         default=False,
@@ -183,3 +213,6 @@ class RadioToolButton(ToolButton):
         nick="Active",
         blurb="Whether the radio button is active",
     )
+
+
+_TOGGLED_SIGNAL_ID = GObject.signal_lookup("toggled", RadioToolButton)
@@ -30,10 +30,58 @@ All the constants are expressed in pixels. They are defined for the XO
 screen and are usually adapted to different resolution by applying a
 zoom factor.
 
+The following colors are created the first time they are accessed:
+
+.. data:: COLOR_TRANSPARENT
+
+   Fully transparent color
+
+.. data:: COLOR_PANEL_GREY
+
+   Default background color of a window
+
+.. data:: COLOR_SELECTION_GREY
+
+   Background color of selected entry
+
+.. data:: COLOR_BUTTON_GREY
+
+   Color of buttons
+
+.. data:: COLOR_INACTIVE_FILL
+
+   Fill colour of an inactive button
+
+.. data:: COLOR_INACTIVE_STROKE
+
+   Stroke colour of an inactive button
+
+.. data:: COLOR_TEXT_FIELD_GREY
+
+   Background color of entry
+
+.. data:: COLOR_HIGHLIGHT
+
+   Color of highlighted text
+
+.. data:: COLOR_SUCCESS
+
+   Success state color
+
+.. data:: COLOR_WARNING
+
+   Warning state color
+
+.. data:: COLOR_ERROR
+
+   Error state color
+
 """
 
+import functools
 import logging
 import os
+import re
 from typing import Tuple
 
 try:
@@ -44,6 +92,7 @@ try:
     from gi.repository import Gdk, Gio, Gtk, Pango
 
     GTK_AVAILABLE = True
+    _APP_PRIORITY = Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
 except (ImportError, ValueError):
     GTK_AVAILABLE = False
 
@@ -64,6 +113,48 @@ _TAB_CURVATURE = 1
 ELLIPSIZE_MODE_DEFAULT = Pango.EllipsizeMode.END
 
 
+# One match per whitespace separated word of a Pango font description
+_FONT_TOKEN_RE = re.compile(
+    r"(?<!\S)(?:(?P<weight>bold|light|medium|heavy)|(?P<style>italic|oblique)"
+    r"|(?P<size>[\d.]*\d[\d.]*)|(?P<family>\S+))(?!\S)",
+    re.IGNORECASE,
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _pango_desc(desc: str):
+    """Returns a Pango.FontDescription for desc, shared by equal strings."""
+    return Pango.FontDescription(desc) if GTK_AVAILABLE else None
+
+
+# Channel byte to float, exactly as byte / 255.0 so get_html() round trips
+_CHANNEL_TO_FLOAT = tuple(value / 255.0 for value in range(256))
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_html(html_color: str) -> Tuple[float, float, float]:
+    """Parse #RRGGBB into (r, g, b) floats, shared by equal strings."""
+    if len(html_color) == 7 and html_color[0] == "#":
+        # Common case, no surrounding whitespace to strip
+        html_color = html_color[1:]
+    else:
+        html_color = html_color.strip()
+        if html_color[:1] == "#":
+            html_color = html_color[1:]
+        if len(html_color) != 6:
+            raise ValueError(f"input #{html_color} is not in #RRGGBB format")
+
+    try:
+        channels = bytes.fromhex(html_color)
+    except ValueError:
+        channels = b""
+    if len(channels) != 3:
+        raise ValueError(f"input #{html_color} is not in #RRGGBB format")
+
+    r, g, b = channels
+    return (_CHANNEL_TO_FLOAT[r], _CHANNEL_TO_FLOAT[g], _CHANNEL_TO_FLOAT[b])
+
+
 def _compute_zoom_factor() -> float:
     """
     Calculates zoom factor based on size of screen.
@@ -88,9 +179,11 @@ class Font:
         desc (str): A description of the Font object in Pango format
     """
 
+    __slots__ = ("_desc", "_css_string")
+
     def __init__(self, desc: str):
         self._desc = desc
-        self._pango_desc = None
+        self._css_string = None
 
     def __str__(self) -> str:
         """Returns description of font."""
@@ -102,18 +195,21 @@ class Font:
     def get_pango_desc(self):
         """
         Returns Pango description of font.
-        Cached for performance.
+        Shared by all fonts with the same description.
         """
-        if self._pango_desc is None and GTK_AVAILABLE:
-            self._pango_desc = Pango.FontDescription(self._desc)
-        return self._pango_desc
+        return _pango_desc(self._desc)
 
     def get_css_string(self) -> str:
         """
         Returns a CSS font specification string for modern styling.
+        Cached for performance.
         """
+        if self._css_string is None:
+            self._css_string = self._build_css_string()
+        return self._css_string
+
+    def _build_css_string(self) -> str:
         # Convert Pango description to CSS-compatible format
-        parts = self._desc.split()
         css_parts = []
 
         size = None
@@ -121,15 +217,16 @@ class Font:
         style = "normal"
         family = []
 
-        for part in parts:
-            if part.lower() in ["bold", "light", "medium", "heavy"]:
-                weight = part.lower()
-            elif part.lower() in ["italic", "oblique"]:
-                style = part.lower()
-            elif part.replace(".", "").isdigit():
-                size = part
+        for match in _FONT_TOKEN_RE.finditer(self._desc):
+            kind = match.lastgroup
+            if kind == "weight":
+                weight = match.group().lower()
+            elif kind == "style":
+                style = match.group().lower()
+            elif kind == "size":
+                size = match.group()
             else:
-                family.append(part)
+                family.append(match.group())
 
         if family:
             css_parts.append(f"font-family: {' '.join(family)}")
@@ -155,9 +252,34 @@ class Color:
         alpha (float): Transparency of color (0.0 to 1.0)
     """
 
+    __slots__ = (
+        "_r",
+        "_g",
+        "_b",
+        "_a",
+        "_r255",
+        "_g255",
+        "_b255",
+        "_html",
+        "_css_rgba",
+        "_int",
+        "_gdk_rgba",
+    )
+
     def __init__(self, color: str, alpha: float = 1.0):
-        self._r, self._g, self._b = self._html_to_rgb(color)
+        self._set_channels(*self._html_to_rgb(color), alpha)
+
+    def _set_channels(self, r: float, g: float, b: float, alpha: float) -> None:
+        self._r, self._g, self._b = r, g, b
         self._a = max(0.0, min(1.0, alpha))  # Clamp alpha to valid range
+        self._r255 = int(r * 255)
+        self._g255 = int(g * 255)
+        self._b255 = int(b * 255)
+        # Colors are immutable, string forms are built on first use
+        self._html = None
+        self._css_rgba = None
+        self._int = None
+        self._gdk_rgba = None
 
     def __str__(self) -> str:
         return f"Color({self.get_html()}, alpha={self._a})"
@@ -175,26 +297,31 @@ class Color:
         """
         Returns color encoded as an int, in the form rgba.
         """
-        return (
-            int(self._a * 255)
-            + (int(self._b * 255) << 8)
-            + (int(self._g * 255) << 16)
-            + (int(self._r * 255) << 24)
-        )
+        if self._int is None:
+            self._int = (
+                int(self._a * 255)
+                + (self._b255 << 8)
+                + (self._g255 << 16)
+                + (self._r255 << 24)
+            )
+        return self._int
 
     def get_gdk_rgba(self):
         """
         Returns GDK RGBA color object for GTK4.
         This replaces the deprecated get_gdk_color method.
+        The object is shared between calls and must not be modified.
         """
         if not GTK_AVAILABLE:
             return None
-        rgba = Gdk.RGBA()
-        rgba.red = self._r
-        rgba.green = self._g
-        rgba.blue = self._b
-        rgba.alpha = self._a
-        return rgba
+        if self._gdk_rgba is None:
+            rgba = Gdk.RGBA()
+            rgba.red = self._r
+            rgba.green = self._g
+            rgba.blue = self._b
+            rgba.alpha = self._a
+            self._gdk_rgba = rgba
+        return self._gdk_rgba
 
     def get_gdk_color(self):
         """
@@ -212,17 +339,19 @@ class Color:
         """
         Returns string in the standard HTML color format (#FFFFFF).
         """
-        return "#%02x%02x%02x" % (
-            int(self._r * 255),
-            int(self._g * 255),
-            int(self._b * 255),
-        )
+        if self._html is None:
+            self._html = "#%02x%02x%02x" % (self._r255, self._g255, self._b255)
+        return self._html
 
     def get_css_rgba(self) -> str:
         """
         Returns CSS rgba() string for GTK4 styling.
         """
-        return f"rgba({int(self._r * 255)}, {int(self._g * 255)}, {int(self._b * 255)}, {self._a})"
+        if self._css_rgba is None:
+            self._css_rgba = (
+                f"rgba({self._r255}, {self._g255}, {self._b255}, {self._a})"
+            )
+        return self._css_rgba
 
     def _html_to_rgb(self, html_color: str) -> Tuple[float, float, float]:
         """
@@ -232,17 +361,7 @@ class Color:
         Args:
             html_color (str): HTML string in the format #FFFFFF
         """
-        html_color = html_color.strip()
-        if html_color[0] == "#":
-            html_color = html_color[1:]
-        if len(html_color) != 6:
-            raise ValueError(f"input #{html_color} is not in #RRGGBB format")
-
-        r, g, b = html_color[:2], html_color[2:4], html_color[4:]
-        r, g, b = [int(n, 16) for n in (r, g, b)]
-        r, g, b = (r / 255.0, g / 255.0, b / 255.0)
-
-        return (r, g, b)
+        return _parse_html(html_color)
 
     def get_svg(self) -> str:
         """
@@ -258,23 +377,27 @@ class Color:
         """
         Returns a new Color with the specified alpha value.
         """
-        return Color(self.get_html(), alpha)
+        color = Color.__new__(Color)
+        color._set_channels(self._r, self._g, self._b, alpha)
+        return color
 
 
-def zoom(units: float) -> int:
-    """
-    Returns size of units pixels at current zoom level.
-
-    Args:
-        units (int or float): Size of item at full size
-    """
-    return int(ZOOM_FACTOR * units)
+@functools.lru_cache(maxsize=128)
+def _provider_for(css: str):
+    """Returns a CSS provider loaded with css, shared by equal strings."""
+    css_provider = Gtk.CssProvider()
+    css_provider.load_from_string(css)
+    return css_provider
 
 
 def apply_css_to_widget(widget, css: str) -> None:
     """
     Apply CSS styling to a widget.
 
+    The CSS only affects this widget. When the selectors already limit
+    the CSS to the right widgets, apply_css_to_display() is cheaper.
+    Applying the CSS that was last applied to a widget again does nothing.
+
     Args:
         widget: Widget to style
         css (str): CSS string to apply
@@ -282,18 +405,77 @@ def apply_css_to_widget(widget, css: str) -> None:
     if not GTK_AVAILABLE:
         return
 
+    # Re-adding the newest provider would not change the cascade order
+    if getattr(widget, "_sugar_last_css", None) == css:
+        return
+
     try:
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_string(css)
+        css_provider = _provider_for(css)
 
         context = widget.get_style_context()
-        context.add_provider(css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
+        context.add_provider(css_provider, _APP_PRIORITY)
     except Exception as e:
         logging.warning(f"Failed to apply CSS: {e}")
+        return
+
+    widget._sugar_last_css = css
+
+
+_display_css = set()
+
+
+def apply_css_to_display(css: str, display=None) -> bool:
+    """
+    Apply CSS styling to all widgets of a display.
+
+    The provider is attached once per display and CSS string, so calling
+    this for every new widget costs a set lookup.
+
+    Args:
+        css (str): CSS string to apply
+        display: Display to style, defaults to the default display
+
+    Returns:
+        True if the CSS was attached by this call, False if it was
+        already attached or there was no display to style yet
+    """
+    if not GTK_AVAILABLE:
+        return False
+
+    if display is None:
+        display = Gdk.Display.get_default()
+        if display is None:
+            return False
+
+    key = (display, css)
+    if key in _display_css:
+        return False
+
+    # Failures are not retried, the same CSS would fail again
+    _display_css.add(key)
+    try:
+        Gtk.StyleContext.add_provider_for_display(
+            display, _provider_for(css), _APP_PRIORITY
+        )
+    except Exception as e:
+        logging.warning(f"Failed to apply CSS: {e}")
+    return True
 
 
 ZOOM_FACTOR = _compute_zoom_factor()  #: Scale factor, as float (eg. 0.72, 1.0)
 
+
+def zoom(units: float, _zoom_factor: float = ZOOM_FACTOR) -> int:
+    """
+    Returns size of units pixels at current zoom level.
+
+    Args:
+        units (int or float): Size of item at full size
+    """
+    # ZOOM_FACTOR is bound as a default so calls read a local, not a global
+    return int(_zoom_factor * units)
+
+
 DEFAULT_SPACING = zoom(15)  #: Spacing is placed in-between elements
 DEFAULT_PADDING = zoom(6)  #: Padding is placed around an element
 
@@ -315,9 +497,15 @@ LARGE_ICON_SIZE = zoom(55 * 2.0)
 XLARGE_ICON_SIZE = zoom(55 * 2.75)
 
 # Font settings
-if GTK_AVAILABLE and "org.sugarlabs.font" in Gio.Settings.list_schemas():
+_font_schema = None
+if GTK_AVAILABLE:
+    _schema_source = Gio.SettingsSchemaSource.get_default()
+    if _schema_source is not None:
+        _font_schema = _schema_source.lookup("org.sugarlabs.font", True)
+
+if _font_schema is not None:
     try:
-        settings = Gio.Settings("org.sugarlabs.font")
+        settings = Gio.Settings.new_full(_font_schema, None, None)
         FONT_SIZE = settings.get_double("default-size")  #: User's preferred font size
         FONT_FACE = settings.get_string("default-face")  #: User's preferred font face
     except Exception:
@@ -340,6 +528,10 @@ FONT_BOLD_H = zoom(24)
 #: Italic font
 FONT_ITALIC = Font(f"{FONT_FACE} italic {FONT_SIZE}")
 
+for _font in (FONT_NORMAL, FONT_BOLD, FONT_ITALIC):
+    _font.get_css_string()
+del _font
+
 
 # old style toolbox design (maintained for compatibility)
 TOOLBOX_SEPARATOR_HEIGHT = zoom(9)
@@ -350,30 +542,41 @@ TOOLBOX_TAB_LABEL_WIDTH = zoom(150 - 15 * 2)
 
 COLOR_BLACK = Color("#000000")  #: Black
 COLOR_WHITE = Color("#FFFFFF")  #: White
-#: Fully transparent color
-COLOR_TRANSPARENT = Color("#FFFFFF", alpha=0.0)
-#: Default background color of a window
-COLOR_PANEL_GREY = Color("#C0C0C0")
-#: Background color of selected entry
-COLOR_SELECTION_GREY = Color("#A6A6A6")
 #: Color of toolbars
 COLOR_TOOLBAR_GREY = Color("#282828")
-#: Color of buttons
-COLOR_BUTTON_GREY = Color("#808080")
-#: Fill colour of an inactive button
-COLOR_INACTIVE_FILL = Color("#9D9FA1")
-#: Stroke colour of an inactive button
-COLOR_INACTIVE_STROKE = Color("#757575")
-#: Background color of entry
-COLOR_TEXT_FIELD_GREY = Color("#E5E5E5")
-#: Color of highlighted text
-COLOR_HIGHLIGHT = Color("#E7E7E7")
 
 # Additional GTK4-specific colors
 COLOR_PRIMARY = Color("#0066CC")  #: Primary accent color
-COLOR_SUCCESS = Color("#00AA00")  #: Success state color
-COLOR_WARNING = Color("#FF8800")  #: Warning state color
-COLOR_ERROR = Color("#CC0000")  #: Error state color
+
+# Less used colors are built on first access, see __getattr__
+_LAZY_COLORS = {
+    "COLOR_TRANSPARENT": ("#FFFFFF", 0.0),
+    "COLOR_PANEL_GREY": ("#C0C0C0",),
+    "COLOR_SELECTION_GREY": ("#A6A6A6",),
+    "COLOR_BUTTON_GREY": ("#808080",),
+    "COLOR_INACTIVE_FILL": ("#9D9FA1",),
+    "COLOR_INACTIVE_STROKE": ("#757575",),
+    "COLOR_TEXT_FIELD_GREY": ("#E5E5E5",),
+    "COLOR_HIGHLIGHT": ("#E7E7E7",),
+    "COLOR_SUCCESS": ("#00AA00",),
+    "COLOR_WARNING": ("#FF8800",),
+    "COLOR_ERROR": ("#CC0000",),
+}
+
+
+def __getattr__(name: str):
+    """Build the colors listed in the module docstring on first access."""
+    try:
+        args = _LAZY_COLORS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    color = globals()[name] = Color(*args)
+    return color
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_COLORS))
+
 
 # Palette and UI constants
 PALETTE_CURSOR_DISTANCE = zoom(
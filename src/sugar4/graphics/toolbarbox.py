@@ -33,7 +33,7 @@ import gi
 gi.require_version("Gtk", "4.0")
 gi.require_version("GObject", "2.0")
 
-from gi.repository import Gtk, GObject, Gdk, Graphene
+from gi.repository import Gtk, GObject, Gdk, GLib, Graphene
 import logging
 
 from sugar4.graphics.toolbutton import ToolButton
@@ -49,6 +49,18 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _grey(level):
+    color = Gdk.RGBA()
+    color.red = color.green = color.blue = level
+    color.alpha = 1.0
+    return color
+
+
+# Snapshot colors, GTK copies them into the render nodes so they are shared
+_ARROW_COLOR = _grey(0.5)
+_LINE_COLOR = _grey(0.7)
+
+
 class ToolbarButton(ToolButton):
     """
     A toolbar button that can expand to show a toolbar page inline.
@@ -64,6 +76,9 @@ class ToolbarButton(ToolButton):
 
         self.page_widget = None
         self._expanded = False
+        self._toolbar_box = None
+        self._arrow_rect = Graphene.Rect()
+        self._page_idle_id = 0
 
         self.set_page(page)
 
@@ -77,17 +92,18 @@ class ToolbarButton(ToolButton):
 
     def _hierarchy_changed_cb(self, widget, pspec):
         parent = self.get_parent()
-        if hasattr(parent, "owner"):
+        if isinstance(parent, _ToolbarInner):
+            self._toolbar_box = parent.owner
             if self.page_widget and self.get_root():
-                self._unparent()
-                parent.owner.append(self.page_widget)
-                self.set_expanded(False)
+                self._expanded = False
+                self.remove_css_class("expanded")
+                self._update_page()
+        else:
+            self._toolbar_box = None
 
     def get_toolbar_box(self):
-        parent = self.get_parent()
-        if not hasattr(parent, "owner"):
-            return None
-        return parent.owner
+        # Kept up to date by _hierarchy_changed_cb on notify::parent
+        return self._toolbar_box
 
     toolbar_box = property(get_toolbar_box)
 
@@ -111,16 +127,17 @@ class ToolbarButton(ToolButton):
 
     page = GObject.Property(type=object, getter=get_page, setter=set_page)
 
-    def is_in_palette(self):
-        palette = self.get_palette()
+    def is_in_palette(self, palette=None):
+        if palette is None:
+            palette = self.get_palette()
         return (
-            self.page is not None
+            self.page_widget is not None
             and palette is not None
             and self.page_widget.get_parent() == palette._widget
         )
 
     def is_expanded(self):
-        return self.page is not None and not self.is_in_palette()
+        return self.page_widget is not None and self._expanded
 
     def popdown(self):
         palette = self.get_palette()
@@ -128,33 +145,66 @@ class ToolbarButton(ToolButton):
             palette.popdown(immediate=True)
 
     def set_expanded(self, expanded):
+        """
+        Expand the page inline below the toolbar or move it back to the
+        palette.
+
+        is_expanded() and the box's expanded_button change right away.
+        The page widget is moved from an idle callback, so a burst of
+        calls only moves it once, for the final state.
+        """
         self.popdown()
         palettegroup.popdown_all()
 
-        if self.page is None or self.is_expanded() == expanded:
+        if self.page_widget is None or self._expanded == expanded:
             return
 
-        if not expanded:
-            self._move_page_to_palette()
-            self._expanded = False
+        box = self._toolbar_box
+        if expanded:
+            if box is None:
+                return
+            previous = box.expanded_button
+            if previous is not None and previous is not self:
+                previous.set_expanded(False)
+            box.expanded_button = self
+            self.add_css_class("expanded")
+        else:
+            if box is not None and box.expanded_button is self:
+                box.expanded_button = None
             self.remove_css_class("expanded")
+
+        self._expanded = expanded
+        if not self._page_idle_id:
+            self._page_idle_id = GLib.idle_add(
+                self.__update_page_cb, priority=GLib.PRIORITY_HIGH_IDLE + 20
+            )
+
+    def __update_page_cb(self):
+        self._page_idle_id = 0
+        self._update_page()
+        return GLib.SOURCE_REMOVE
+
+    def _update_page(self):
+        """Put the page widget where the expanded state says it goes."""
+        if self._page_idle_id:
+            GLib.source_remove(self._page_idle_id)
+            self._page_idle_id = 0
+
+        if self.page_widget is None:
             return
 
-        box = self.toolbar_box
-        if box is None:
+        box = self._toolbar_box
+        if not self._expanded or box is None:
+            self._move_page_to_palette()
             return
 
-        if box.expanded_button is not None:
-            box.expanded_button.set_expanded(False)
-        box.expanded_button = self
+        if self.page_widget.get_parent() is box:
+            return
 
         self._unparent()
         _setup_page(self.page_widget, style.COLOR_TOOLBAR_GREY, box.get_padding())
         box.append(self.page_widget)
 
-        self._expanded = True
-        self.add_css_class("expanded")
-
     def _move_page_to_palette(self):
         """Move the page widget to the palette."""
         if self.is_in_palette():
@@ -207,16 +257,22 @@ class ToolbarButton(ToolButton):
         y = height - arrow_size
         x = (width - arrow_size) / 2
 
-        rect = Graphene.Rect()
+        rect = self._arrow_rect
         rect.init(x, y, arrow_size, arrow_size)
 
-        color = Gdk.RGBA()
-        color.red = 0.5
-        color.green = 0.5
-        color.blue = 0.5
-        color.alpha = 1.0
+        snapshot.append_color(_ARROW_COLOR, rect)
+
+
+class _ToolbarInner(Gtk.Box):
+    """
+    The horizontal toolbar inside a ToolbarBox, linked back to its owner.
+    """
+
+    __gtype_name__ = "SugarToolbarInner"
 
-        snapshot.append_color(color, rect)
+    def __init__(self, owner):
+        super().__init__(orientation=Gtk.Orientation.HORIZONTAL)
+        self.owner = owner
 
 
 class ToolbarBox(Gtk.Box):
@@ -232,11 +288,10 @@ class ToolbarBox(Gtk.Box):
     def __init__(self, padding=style.TOOLBOX_HORIZONTAL_PADDING):
         super().__init__(orientation=Gtk.Orientation.VERTICAL)
 
-        self._expanded_button_index = -1
+        self._expanded_button = None
         self._padding = padding
 
-        self._toolbar = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
-        self._toolbar.owner = self
+        self._toolbar = _ToolbarInner(self)
         # GTK4: Box doesn't have a "remove" signal, we'll handle removal differently
 
         self._toolbar_widget, self._toolbar_alignment = _embed_page(
@@ -270,20 +325,16 @@ class ToolbarBox(Gtk.Box):
     toolbar = property(get_toolbar)
 
     def get_expanded_button(self):
-        if self._expanded_button_index == -1:
-            return None
-        return self._get_nth_toolbar_item(self._expanded_button_index)
+        button = self._expanded_button
+        if button is not None and button.get_parent() is not self._toolbar:
+            # The button was removed from the toolbar since
+            self._expanded_button = button = None
+        return button
 
     def set_expanded_button(self, button):
-        if button is None:
-            self._expanded_button_index = -1
-            return
-
-        index = self._get_toolbar_item_index(button)
-        if index != -1:
-            self._expanded_button_index = index
-        else:
-            self._expanded_button_index = -1
+        if button is not None and button.get_parent() is not self._toolbar:
+            button = None
+        self._expanded_button = button
 
     expanded_button = property(get_expanded_button, set_expanded_button)
 
@@ -299,39 +350,15 @@ class ToolbarBox(Gtk.Box):
 
     padding = GObject.Property(type=object, getter=get_padding, setter=set_padding)
 
-    def _get_nth_toolbar_item(self, index):
-        """Get the nth item from the toolbar."""
-        child = self._toolbar.get_first_child()
-        current_index = 0
-
-        while child and current_index < index:
-            child = child.get_next_sibling()
-            current_index += 1
-
-        return child
-
-    def _get_toolbar_item_index(self, widget):
-        """Get the index of a widget in the toolbar."""
-        child = self._toolbar.get_first_child()
-        index = 0
-
-        while child:
-            if child == widget:
-                return index
-            child = child.get_next_sibling()
-            index += 1
-
-        return -1
-
     def _remove_cb(self, sender, button):
         """Handle removal of toolbar items."""
         if not isinstance(button, ToolbarButton):
             return
         button.popdown()
-        if button == self.expanded_button:
+        if button is self._expanded_button:
             if button.page_widget and button.page_widget.get_parent() == self:
                 self.remove(button.page_widget)
-            self._expanded_button_index = -1
+            self._expanded_button = None
 
 
 class _ToolbarPalette(PaletteWindow):
@@ -433,6 +460,9 @@ class _Box(Gtk.Box):
     def __init__(self, toolbar_button):
         super().__init__(orientation=Gtk.Orientation.VERTICAL)
         self._toolbar_button = toolbar_button
+        self._rect1 = Graphene.Rect()
+        self._rect2 = Graphene.Rect()
+        self._line_geometry = None
 
     def do_snapshot(self, snapshot):
         """Render palette using snapshot drawing."""
@@ -442,27 +472,20 @@ class _Box(Gtk.Box):
         my_width = self.get_width()
 
         if my_width > 0:
-            color = Gdk.RGBA()
-            color.red = 0.7
-            color.green = 0.7
-            color.blue = 0.7
-            color.alpha = 1.0
-
-            line_width = style.FOCUS_LINE_WIDTH * 2
-
-            rect1 = Graphene.Rect()
-            rect1.init(0, 0, button_alloc.x + style.FOCUS_LINE_WIDTH, line_width)
-            snapshot.append_color(color, rect1)
-
-            rect2 = Graphene.Rect()
-            rect2.init(
-                button_alloc.x + button_alloc.width - style.FOCUS_LINE_WIDTH,
-                0,
-                my_width
-                - (button_alloc.x + button_alloc.width - style.FOCUS_LINE_WIDTH),
-                line_width,
-            )
-            snapshot.append_color(color, rect2)
+            geometry = (button_alloc.x, button_alloc.width, my_width)
+            if geometry != self._line_geometry:
+                # Only recompute the lines when the button or the box moved
+                self._line_geometry = geometry
+                line_width = style.FOCUS_LINE_WIDTH * 2
+                gap_end = button_alloc.x + button_alloc.width - style.FOCUS_LINE_WIDTH
+
+                self._rect1.init(
+                    0, 0, button_alloc.x + style.FOCUS_LINE_WIDTH, line_width
+                )
+                self._rect2.init(gap_end, 0, my_width - gap_end, line_width)
+
+            snapshot.append_color(_LINE_COLOR, self._rect1)
+            snapshot.append_color(_LINE_COLOR, self._rect2)
 
 
 def _setup_page(page_widget, color, hpad):
@@ -477,11 +500,9 @@ def _setup_page(page_widget, color, hpad):
 
     page = _get_embedded_page(page_widget)
     if page:
-        css = f"""
-        * {{
-            background: {color.get_css_rgba()};
-        }}
-        """
+        # The providers are shared per CSS string, and adding one again
+        # moves it last, so a page keeps at most one per color
+        css = f"* {{ background: {color.get_css_rgba()}; }}"
         style.apply_css_to_widget(page, css)
 
 
@@ -131,6 +131,7 @@ class ToolButton(Gtk.Button):
         self._hide_tooltip_on_click = kwargs.pop("hide_tooltip_on_click", True)
 
         super().__init__(**kwargs)
+        _apply_module_css()
 
         # button styling for toolbar appearance
         self.add_css_class("toolbar-button")
@@ -459,8 +460,15 @@ class ToolButton(Gtk.Button):
         return self.has_css_class("active")
 
 
+_module_css_applied = False
+
+
 def _apply_module_css():
-    """Apply module-level CSS styling."""
+    """Apply module-level CSS styling, once per process."""
+    global _module_css_applied
+    if _module_css_applied:
+        return
+
     css = """
     /* Additional toolbar button styles */
     .toolbar-button icon {
@@ -483,18 +491,4 @@ def _apply_module_css():
     }
     """
 
-    try:
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_string(css)
-
-        display = Gdk.Display.get_default()
-        if display:
-            Gtk.StyleContext.add_provider_for_display(display, css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
-    except Exception as e:
-        logging.warning(f"Could not apply module CSS: {e}")
-
-
-try:
-    _apply_module_css()
-except Exception:
-    pass
+    _module_css_applied = style.apply_css_to_display(css)
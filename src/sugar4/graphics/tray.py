@@ -707,7 +707,7 @@ def _apply_tray_css():
         background-color: rgba(0, 0, 0, 0.2);
     }
     """
-    style.apply_css_to_widget(None, css)  # Apply globally
+    style.apply_css_to_display(css)
 
 
 try:
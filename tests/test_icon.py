@@ -10,7 +10,7 @@ try:
     import gi
 
     gi.require_version("Gtk", "4.0")
-    from gi.repository import Gtk
+    from gi.repository import Gdk, Gtk
 
     GTK_AVAILABLE = True
 except (ImportError, ValueError):
@@ -44,6 +44,24 @@ class TestIcon(unittest.TestCase):
         self.assertEqual(icon.get_icon_name(), "document-new")
         self.assertEqual(icon.get_pixel_size(), 48)
 
+    def test_icon_texture_shared(self):
+        """Test identical icons share one cached texture."""
+        icon_a = Icon(icon_name="document-new", pixel_size=32)
+        icon_b = Icon(icon_name="document-new", pixel_size=32)
+
+        texture = icon_a._buffer.get_texture()
+        self.assertIsNotNone(texture)
+        self.assertIs(icon_b._buffer.get_texture(), texture)
+
+    def test_icon_texture_cache_cleared_on_theme_change(self):
+        """Test a theme change drops the shared textures."""
+        icon = Icon(icon_name="document-new", pixel_size=32)
+        texture = icon._buffer.get_texture()
+        self.assertIsNotNone(texture)
+
+        Gtk.IconTheme.get_for_display(Gdk.Display.get_default()).emit("changed")
+        self.assertIsNot(icon._buffer.get_texture(), texture)
+
     def test_icon_properties(self):
         """Test icon property setting."""
         icon = Icon()
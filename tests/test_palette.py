@@ -12,13 +12,15 @@ try:
     import gi
 
     gi.require_version("Gtk", "4.0")
-    from gi.repository import Gtk, GObject
+    gi.require_version("Gdk", "4.0")
+    from gi.repository import Gtk, Gdk, GObject
 
     GTK_AVAILABLE = True
 except (ImportError, ValueError):
     GTK_AVAILABLE = False
 
 from sugar4.graphics.palette import Palette, PaletteActionBar, _HeaderItem
+from sugar4.graphics import palettewindow, style
 from sugar4.graphics.palettewindow import (
     PaletteWindow,
     _PaletteWindowWidget,
@@ -42,6 +44,17 @@ def test_palette_creation():
     assert isinstance(palette, PaletteWindow)
 
 
+def test_palette_widget_destroy_clears_cached_methods():
+    palette = Palette()
+    palette.set_content(Gtk.Label(label="Content"))
+    assert palette._widget_popup is not None
+
+    palette._widget.destroy()
+    assert palette._widget is None
+    assert palette._widget_popup is None
+    assert palette._widget_popdown is None
+
+
 def test_primary_text_property():
     palette = Palette()
     palette.set_primary_text("Primary")
@@ -100,6 +113,32 @@ def test_palette_action_bar():
     assert isinstance(btn, Gtk.Button)
 
 
+def test_full_request_cached_until_content_changes():
+    palette = Palette()
+    palette._update_full_request()
+    assert not palette._full_request_dirty
+    palette.set_secondary_text("Secondary")
+    assert palette._full_request_dirty
+    palette._update_full_request()
+    palette.action_bar.add_action("Test")
+    assert palette._full_request_dirty
+    palette._update_full_request()
+    palette.set_icon_visible(False)
+    assert palette._full_request_dirty
+
+
+def test_full_request_follows_held_menu_changes():
+    palette = Palette()
+    menu = palette.get_menu()
+    width, height = palette._update_full_request()
+
+    # Items added through the menu already held, not through get_menu()
+    menu.append(PaletteMenuItem("First"))
+    menu.append(PaletteMenuItem("Second"))
+    assert not palette._full_request_dirty
+    assert palette._update_full_request()[1] > height
+
+
 def test_header_item():
     label = Gtk.Label(label="Header")
     header = _HeaderItem(label)
@@ -170,6 +209,40 @@ def test_mouse_speed_detector():
     detector.stop()
 
 
+def test_mouse_speed_detector_ticks(monkeypatch):
+    positions = [(0, 0), (50, 0), (50, 0)]
+    monkeypatch.setattr(
+        palettewindow, "_get_pointer_position", lambda widget: positions.pop(0)
+    )
+    # Ticks are run by hand below
+    monkeypatch.setattr(palettewindow, "_glib_timeout_add", lambda delay, cb: 1)
+    monkeypatch.setattr(palettewindow, "_glib_source_remove", lambda hid: None)
+    events = []
+    detector = MouseSpeedDetector(10, 5)
+    detector.parent = Gtk.Button()
+    detector.connect("motion-fast", lambda d: events.append("fast"))
+    detector.connect("motion-slow", lambda d: events.append("slow"))
+
+    # The position is recorded at start, a sweeping pointer reports fast
+    detector.start()
+    detector._timer_cb()
+    assert events == ["fast"]
+
+    # A fast tick re-arms itself, so a stopped pointer reports slow
+    assert detector._timeout_hid is not None
+    detector._timer_cb()
+    assert events == ["fast", "slow"]
+    detector.stop()
+
+
+def test_debug_output_follows_runtime_flag(monkeypatch, capsys):
+    monkeypatch.delenv("SUGAR_DEBUG", raising=False)
+    palettewindow.print("hidden")
+    monkeypatch.setenv("SUGAR_DEBUG", "1")
+    palettewindow.print("shown")
+    assert capsys.readouterr().out == "shown\n"
+
+
 def test_invoker_properties():
     invoker = Invoker()
     invoker.set_cache_palette(False)
@@ -180,6 +253,50 @@ def test_invoker_properties():
     assert invoker.get_lock_palette()
 
 
+def test_invoker_area_in_screen():
+    invoker = Invoker()
+    screen = Gdk.Rectangle()
+    screen.x = screen.y = 0
+    screen.width = 100
+    screen.height = 80
+    invoker._set_screen_area(screen)
+
+    assert invoker._in_screen((10, 10, 20, 20))
+    assert not invoker._in_screen((90, 10, 20, 20))
+    assert invoker._get_area_in_screen((90, 70, 20, 20)) == 100
+    # Disjoint rectangles, including ones off screen on both axes
+    assert invoker._get_area_in_screen((100, 10, 20, 20)) == 0
+    assert invoker._get_area_in_screen((-30, -30, 20, 20)) == 0
+
+
+def test_invoker_alignment_follows_cursor(monkeypatch):
+    pointer = [(90, 90)]
+    monkeypatch.setattr(
+        palettewindow, "_get_pointer_position", lambda widget: pointer[0]
+    )
+    invoker = Invoker()
+    invoker.parent = Gtk.Button()
+    invoker._position_hint = Invoker.AT_CURSOR
+    screen = Gdk.Rectangle()
+    screen.x = screen.y = 0
+    screen.width = screen.height = 200
+    invoker._set_screen_area(screen)
+    alignments = invoker._get_alignments()
+    size = (style.PALETTE_CURSOR_DISTANCE * 6, style.PALETTE_CURSOR_DISTANCE * 6)
+
+    # Near the bottom right corner only a later alignment fits
+    pointer[0] = (190, 190)
+    invoker._cursor_x = invoker._cursor_y = -1
+    alignment, pos = invoker._compute_best_alignment_and_rect(size)
+    assert alignment != alignments[0]
+
+    # Back in the middle the first alignment fits again and wins
+    pointer[0] = (100, 100)
+    invoker._cursor_x = invoker._cursor_y = -1
+    alignment, pos = invoker._compute_best_alignment_and_rect(size)
+    assert alignment == alignments[0]
+
+
 def test_widget_invoker():
     btn = Gtk.Button()
     invoker = WidgetInvoker(widget=btn)
@@ -188,6 +305,17 @@ def test_widget_invoker():
     assert invoker.get_widget() is None
 
 
+def test_widget_invoker_gestures_attached_eagerly():
+    btn = Gtk.Button()
+    invoker = WidgetInvoker(widget=btn)
+    kinds = {type(controller) for controller in invoker._controllers}
+    assert Gtk.GestureClick in kinds
+    assert Gtk.GestureLongPress in kinds
+
+    invoker.detach()
+    assert invoker._controllers == []
+
+
 def test_cursor_invoker():
     box = Gtk.Box()
     invoker = CursorInvoker(parent=box)
@@ -0,0 +1,183 @@
+"""
+Tests for PaletteMenu (GTK4)
+"""
+
+import sys
+import os
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+try:
+    import gi
+
+    gi.require_version("Gtk", "4.0")
+    from gi.repository import Gtk
+
+    GTK_AVAILABLE = True
+except (ImportError, ValueError):
+    GTK_AVAILABLE = False
+
+if GTK_AVAILABLE:
+    from sugar4.graphics import style
+    from sugar4.graphics.palettemenu import (
+        PaletteMenuBox,
+        PaletteMenuBuilder,
+        PaletteMenuItem,
+        PaletteMenuItemSeparator,
+    )
+
+pytestmark = pytest.mark.skipif(not GTK_AVAILABLE, reason="GTK4 not available")
+
+
+def _children(widget):
+    children = []
+    child = widget.get_first_child()
+    while child is not None:
+        children.append(child)
+        child = child.get_next_sibling()
+    return children
+
+
+def test_menu_box_is_a_box():
+    box = PaletteMenuBox()
+    assert isinstance(box, Gtk.Box)
+    assert box.get_orientation() == Gtk.Orientation.VERTICAL
+
+    first = PaletteMenuItem("First")
+    second = PaletteMenuItem("Second")
+    box.append_item(second)
+    box.prepend(first)
+    assert _children(box) == [first, second]
+
+
+def test_menu_box_remove_keeps_order():
+    box = PaletteMenuBox()
+    items = [PaletteMenuItem(str(i)) for i in range(3)]
+    for item in items:
+        box.append_item(item)
+
+    box.remove(items[1])
+    last = PaletteMenuItem("Last")
+    box.append_item(last)
+    assert _children(box) == [items[0], items[2], last]
+
+
+def test_menu_box_items_are_not_wrapped():
+    box = PaletteMenuBox()
+    item = PaletteMenuItem("Item")
+    separator = PaletteMenuItemSeparator()
+    box.append_item(item)
+    box.append_item(separator)
+    assert _children(box) == [item, separator]
+
+
+def test_menu_box_wraps_widgets_with_padding():
+    box = PaletteMenuBox()
+    label = Gtk.Label(label="Widget")
+    box.append_item(label, horizontal_padding=3)
+
+    wrapper = label.get_parent()
+    assert wrapper.get_parent() is box
+    assert isinstance(wrapper, Gtk.Box)
+    assert wrapper.get_margin_start() == 3
+    assert wrapper.get_margin_end() == 3
+    assert wrapper.get_margin_top() == style.DEFAULT_SPACING
+    assert wrapper.get_margin_bottom() == style.DEFAULT_SPACING
+    assert not label.get_hexpand()
+    assert label.get_halign() == Gtk.Align.FILL
+
+
+def test_menu_box_extend_items():
+    box = PaletteMenuBox()
+    label = Gtk.Label(label="Widget")
+    items = [PaletteMenuItem("First"), PaletteMenuItemSeparator(), label]
+    box.extend_items(items)
+
+    children = _children(box)
+    assert children[:2] == items[:2]
+    assert children[2] is label.get_parent()
+    assert len(children) == 3
+
+
+def test_menu_box_extend_items_keeps_box_visible():
+    box = PaletteMenuBox()
+    visibility = []
+    box.connect("notify::visible", lambda *args: visibility.append(box.get_visible()))
+
+    box.extend_items([PaletteMenuItem("First"), PaletteMenuItem("Second")])
+    assert box.get_visible()
+    assert visibility == []
+
+
+def test_menu_builder_add_items():
+    builder = PaletteMenuBuilder()
+    items = builder.add_items(
+        [
+            {"text": "Cut", "group": "edit"},
+            {"text": "Copy", "group": "edit"},
+            {"text": "About"},
+        ]
+    )
+
+    assert _children(builder.get_menu_box()) == items
+    assert builder.get_group("edit").items == items[:2]
+    assert [item.get_label() for item in items] == ["Cut", "Copy", "About"]
+
+
+def test_menu_item_grid_created_on_first_use():
+    item = PaletteMenuItem()
+    assert item._grid is None
+    assert item.get_child() is None
+
+    item.set_accelerator("Ctrl+S")
+    assert item._grid is not None
+    assert item.get_child() is item._grid
+
+
+def test_menu_item_accelerator_reused():
+    item = PaletteMenuItem("Save", accelerator="Ctrl+S")
+    accelerator = item._accelerator_label
+    assert accelerator.get_parent() is item._grid
+
+    item.set_accelerator("Ctrl+Shift+PgDn")
+    assert item._accelerator_label is accelerator
+    assert accelerator.get_text() == "Ctrl+Shift+PgDn"
+
+    item.set_accelerator(None)
+    assert item._accelerator_label is None
+    assert accelerator.get_parent() is None
+
+
+def _count_signals(item):
+    counts = {"item-activated": 0, "activate": 0}
+
+    def count(signal):
+        def cb(*args):
+            counts[signal] += 1
+
+        return cb
+
+    for signal in counts:
+        item.connect(signal, count(signal))
+    return counts
+
+
+def test_menu_item_click_emits_both_signals_once():
+    item = PaletteMenuItem("Item")
+    counts = _count_signals(item)
+
+    item.emit("clicked")
+    assert counts == {"item-activated": 1, "activate": 1}
+
+    item.emit("clicked")
+    assert counts == {"item-activated": 2, "activate": 2}
+
+
+def test_menu_item_compat_activate_does_not_click_again():
+    item = PaletteMenuItem("Item")
+    clicks = []
+    item.connect("clicked", lambda button: clicks.append(button))
+
+    item.emit("clicked")
+    assert len(clicks) == 1
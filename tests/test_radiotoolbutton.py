@@ -102,6 +102,20 @@ class TestRadioToolButton(unittest.TestCase):
         button2.set_active(True)
         self.assertEqual(signal_count, 3)  # button1 toggled off, button2 toggled on
 
+    def test_toggled_class_handler(self):
+        """Test that a do_toggled override runs without connected handlers."""
+        calls = []
+
+        class _Button(RadioToolButton):
+            __gtype_name__ = "TestToggledClassHandlerButton"
+
+            def do_toggled(self):
+                calls.append(self.get_active())
+
+        button = _Button(icon_name="test")
+        button.set_active(True)
+        self.assertEqual(calls, [True])
+
     def test_click_behavior(self):
         """Test click behavior."""
         button1 = RadioToolButton(icon_name="test1")
@@ -136,6 +150,22 @@ class TestRadioToolButton(unittest.TestCase):
         self.assertEqual(len(button2.get_group()), 3)
         self.assertEqual(len(button3.get_group()), 3)
 
+    def test_join_group_with_active_member(self):
+        """Test that joining a group keeps one active button."""
+        button1 = RadioToolButton(icon_name="test1")
+        button2 = RadioToolButton(icon_name="test2")
+
+        button1.set_active(True)
+        button2.set_active(True)
+        button2.set_group(button1)
+
+        self.assertTrue(button1.get_active())
+        self.assertFalse(button2.get_active())
+
+        button2.set_active(True)
+        self.assertFalse(button1.get_active())
+        self.assertTrue(button2.get_active())
+
     def test_active_property(self):
         """Test active property."""
         button = RadioToolButton(icon_name="test")
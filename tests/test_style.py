@@ -217,6 +217,32 @@ class TestStyleGTKIntegration(unittest.TestCase):
         # Should not raise an exception
         style.apply_css_to_widget(button, css)
 
+    def test_apply_css_to_widget_twice(self):
+        """Test that reapplying the same CSS to a widget is skipped."""
+        button = Gtk.Button(label="Test")
+        css = "button { color: blue; }"
+
+        style.apply_css_to_widget(button, css)
+        style.apply_css_to_widget(button, css)
+        self.assertEqual(button._sugar_last_css, css)
+
+        # Switching back to earlier CSS must apply it again
+        style.apply_css_to_widget(button, "button { color: red; }")
+        style.apply_css_to_widget(button, css)
+        self.assertEqual(button._sugar_last_css, css)
+
+    def test_apply_css_to_display(self):
+        """Test CSS application to the default display."""
+        css = ".test-display-css { color: red; }"
+
+        display = Gdk.Display.get_default()
+        style._display_css.discard((display, css))
+
+        # Applying the same CSS twice attaches it once
+        self.assertTrue(style.apply_css_to_display(css))
+        self.assertIn((display, css), style._display_css)
+        self.assertFalse(style.apply_css_to_display(css))
+
     def test_css_integration_with_colors(self):
         """Test CSS integration with Color objects."""
         color = style.COLOR_PRIMARY
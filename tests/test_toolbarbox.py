@@ -11,10 +11,11 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 import gi
 
 gi.require_version("Gtk", "4.0")
-from gi.repository import Gtk
+from gi.repository import GLib, Gtk
 
 from sugar4.graphics.toolbarbox import ToolbarBox, ToolbarButton
 from sugar4.graphics.toolbutton import ToolButton
+from sugar4.graphics.colorbutton import ColorToolButton
 
 
 class TestToolbarBox(unittest.TestCase):
@@ -61,6 +62,15 @@ class TestToolbarBox(unittest.TestCase):
 
         self.assertEqual(self.toolbarbox.expanded_button, button)
 
+    def test_expanded_button_removed(self):
+        """Test expanded button is forgotten once removed from the toolbar."""
+        button = ToolbarButton(page=Gtk.Box(), icon_name="edit-copy")
+        self.toolbarbox.toolbar.append(button)
+        self.toolbarbox.set_expanded_button(button)
+
+        self.toolbarbox.toolbar.remove(button)
+        self.assertIsNone(self.toolbarbox.get_expanded_button())
+
 
 class TestToolbarButton(unittest.TestCase):
     """Test cases for ToolbarButton widget."""
@@ -168,6 +178,44 @@ class TestToolbarBoxIntegration(unittest.TestCase):
         view_button.set_expanded(True)
         # edit_button should now be collapsed
 
+    def test_set_expanded_coalesced(self):
+        """Test that set_expanded updates the state before the page moves."""
+        edit_button = ToolbarButton(page=Gtk.Box(), icon_name="toolbar-edit")
+        view_button = ToolbarButton(page=Gtk.Box(), icon_name="toolbar-view")
+        self.toolbar.append(edit_button)
+        self.toolbar.append(view_button)
+
+        edit_button.set_expanded(True)
+        view_button.set_expanded(True)
+        self.assertFalse(edit_button.is_expanded())
+        self.assertTrue(view_button.is_expanded())
+        self.assertIs(self.toolbarbox.expanded_button, view_button)
+        self.assertIsNot(view_button.page_widget.get_parent(), self.toolbarbox)
+
+        context = GLib.MainContext.default()
+        while context.iteration(False):
+            pass
+        self.assertIs(view_button.page_widget.get_parent(), self.toolbarbox)
+        self.assertIsNot(edit_button.page_widget.get_parent(), self.toolbarbox)
+
+        view_button.set_expanded(False)
+        self.assertFalse(view_button.is_expanded())
+        self.assertIsNone(self.toolbarbox.expanded_button)
+
+    def test_expand_after_other_expandable_item(self):
+        """Test expanding after a non-ToolbarButton was the expanded item."""
+        color_button = ColorToolButton()
+        edit_button = ToolbarButton(page=Gtk.Box(), icon_name="toolbar-edit")
+        self.toolbar.append(color_button)
+        self.toolbar.append(edit_button)
+
+        color_button.set_expanded(True)
+        self.assertIs(self.toolbarbox.expanded_button, color_button)
+
+        edit_button.set_expanded(True)
+        self.assertIs(self.toolbarbox.expanded_button, edit_button)
+        self.assertTrue(edit_button.is_expanded())
+
     def test_multiple_toolbarbox_instances(self):
         """Test multiple ToolbarBox instances."""
         toolbarbox2 = ToolbarBox()